@@ -1,10 +1,17 @@
 """Test the cache_helper module."""
+import pickle
 import unittest
+import unittest.mock as mock
 
 import pandas as pd
 
 from tests.test_utils import replace_config
-from varats.data.cache_helper import build_cached_report_table
+from varats.data.cache_helper import (
+    build_cached_report_table,
+    cache_object,
+    get_object_cache_file_path,
+    load_cached_object_or_none,
+)
 
 
 class TestCacheHelper(unittest.TestCase):
@@ -74,3 +81,56 @@ class TestCacheHelper(unittest.TestCase):
             self.assertNotIn("a2", df["entry"].values)
             self.assertIn("b", df["entry"].values)
             self.assertIn("c2", df["entry"].values)
+
+    def test_cache_object(self):
+        """Check whether objects are pickled to and loaded from the cache."""
+        with replace_config():
+            self.assertIsNone(load_cached_object_or_none("cache_test_obj"))
+
+            cache_object("cache_test_obj", {"a": [1, 2]})
+            self.assertEqual(
+                load_cached_object_or_none("cache_test_obj"), {"a": [1, 2]}
+            )
+
+    def test_load_broken_cached_object(self):
+        """Check that unloadable cache files are treated as missing."""
+        with replace_config():
+            cache_object("cache_test_obj", {"a": [1, 2]})
+            cache_file = get_object_cache_file_path("cache_test_obj")
+
+            # truncated pickle
+            cache_file.write_bytes(cache_file.read_bytes()[:5])
+            self.assertIsNone(load_cached_object_or_none("cache_test_obj"))
+
+            # pickle of a class that no longer exists
+            cache_file.write_bytes(
+                pickle.dumps(TestCacheHelper).replace(
+                    b"test_cache_helper", b"test_cache_gone__"
+                )
+            )
+            self.assertIsNone(load_cached_object_or_none("cache_test_obj"))
+
+    def test_build_cached_report_table_unchanged(self):
+        """Check that an unchanged cache is not written again."""
+
+        def create_cache_entry_data(entry: str):
+            return pd.DataFrame({"entry": entry}, index=[0]), entry, "1"
+
+        def build_table():
+            return build_cached_report_table(
+                "cache_test_unchanged", "project", ["a", "b"], [],
+                lambda: pd.DataFrame(columns=["entry"]),
+                create_cache_entry_data, lambda entry: entry, lambda entry: "1",
+                lambda ts1, ts2: int(ts1) > int(ts2)
+            )
+
+        with replace_config():
+            build_table()
+            with mock.patch(
+                "varats.data.cache_helper.cache_dataframe"
+            ) as cache_mock:
+                df = build_table()
+                cache_mock.assert_not_called()
+
+            self.assertIn("a", df["entry"].values)
+            self.assertIn("b", df["entry"].values)
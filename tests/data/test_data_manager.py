@@ -0,0 +1,46 @@
+"""Test the DataManager module."""
+import os
+import tempfile
+import unittest
+import unittest.mock as mock
+from pathlib import Path
+
+from tests.test_utils import replace_config
+from varats.data.data_manager import DataManager
+from varats.data.reports.empty_report import EmptyReport
+
+
+class TestDataManager(unittest.TestCase):
+    """Test the DataManager."""
+
+    def test_persisted_data_class(self):
+        """Check whether persisted data classes are only reused if the report
+        file and the data class version are unchanged."""
+
+        def load_report(report_path: Path) -> mock.MagicMock:
+            with mock.patch(
+                "varats.data.data_manager.cache_object"
+            ) as cache_object_mock:
+                DataManager().load_data_class_sync(
+                    report_path, EmptyReport, persist=True
+                )
+            return cache_object_mock
+
+        with replace_config(), tempfile.TemporaryDirectory() as tmp_dir:
+            report_path = Path(tmp_dir) / "report.txt"
+            report_path.write_text("foo")
+            DataManager().load_data_class_sync(
+                report_path, EmptyReport, persist=True
+            )
+
+            load_report(report_path).assert_not_called()
+
+            with mock.patch.object(EmptyReport, "CACHE_VERSION", 2):
+                load_report(report_path).assert_called_once()
+
+            file_stat = report_path.stat()
+            os.utime(
+                report_path,
+                ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000000000)
+            )
+            load_report(report_path).assert_called_once()
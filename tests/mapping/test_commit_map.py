@@ -0,0 +1,37 @@
+"""Test module for CommitMap tests."""
+
+import unittest
+
+from varats.mapping.commit_map import CommitMap
+
+COMMIT_MAP_LINES = [
+    "0, 8e3d5f1a2b7c9d0e1f2a3b4c5d6e7f8091a2b3c4\n",
+    "1, 2f4e6d8c0a1b3c5d7e9f0a2b4c6d8e0f1a3b5c7d\n",
+    "2, 2f4a1b2c3d4e5f60718293a4b5c6d7e8f9012345\n",
+]
+
+
+class TestCommitMap(unittest.TestCase):
+    """Test if CommitMap is working."""
+
+    def test_short_time_id(self) -> None:
+        """Check if short hashes are resolved to the right time ids."""
+        c_map = CommitMap(COMMIT_MAP_LINES)
+
+        self.assertEqual(c_map.short_time_id("8e3d5f1a2b"), 0)
+        self.assertEqual(c_map.short_time_id("2f4e6d8c0a"), 1)
+        self.assertEqual(c_map.short_time_id("2f4a1b2c3d"), 2)
+
+    def test_short_time_id_repeated_lookup(self) -> None:
+        """Check if repeated lookups of a short hash return the same id."""
+        c_map = CommitMap(COMMIT_MAP_LINES)
+
+        self.assertEqual(c_map.short_time_id("2f4a"), 2)
+        self.assertEqual(c_map.short_time_id("2f4a"), 2)
+
+    def test_short_time_id_unknown_hash(self) -> None:
+        """Check if unknown short hashes raise a KeyError."""
+        c_map = CommitMap(COMMIT_MAP_LINES)
+
+        self.assertRaises(KeyError, c_map.short_time_id, "deadbeef")
+        self.assertRaises(KeyError, c_map.short_time_id, "deadbeef")
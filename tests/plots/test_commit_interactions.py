@@ -0,0 +1,38 @@
+"""Test the commit interaction plot."""
+import unittest
+import unittest.mock as mock
+
+import pandas as pd
+
+from varats.mapping.commit_map import CommitMap
+from varats.plots.commit_interactions import InteractionPlot
+
+
+class TestInteractionPlot(unittest.TestCase):
+    """Test the commit interaction plot."""
+
+    def test_calc_missing_revisions(self):
+        """Check if revisions are sampled between revisions with steep
+        interaction gradients."""
+        commit_map = CommitMap([
+            "0, aaaaaaaaaa", "1, bbbbbbbbbb", "2, cccccccccc", "3, dddddddddd",
+            "4, eeeeeeeeee", "5, ffffffffff"
+        ])
+        data_frame = pd.DataFrame({
+            "revision": ["ffffffffff", "aaaaaaaaaa", "eeeeeeeeee"],
+            "time_id": [5, 0, 4],
+            "CFInteractions": [40, 10, 20],
+            "DFInteractions": [5, 5, 5],
+            "HEAD CF Interactions": [0, 0, 0],
+            "HEAD DF Interactions": [0, 0, 0]
+        })
+
+        plot = InteractionPlot(
+            project="test", get_cmap=lambda: commit_map, git_path="test"
+        )
+        with mock.patch(
+            "varats.plots.commit_interactions._gen_interaction_graph",
+            return_value=data_frame
+        ), mock.patch("builtins.print"):
+            self.assertEqual({"cccccccccc"}, plot.calc_missing_revisions(0.2))
+            self.assertEqual(set(), plot.calc_missing_revisions(1.0))
@@ -0,0 +1,104 @@
+"""Test project utilities."""
+import tempfile
+import typing as tp
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from benchbuild.source import Git
+from benchbuild.utils.cmd import git
+from plumbum import local
+
+import varats.project.project_util as project_util
+from varats.project.project_util import (
+    get_gnulib_reference_path,
+    update_git_submodules,
+)
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "test",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "test",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+    "GIT_ALLOW_PROTOCOL": "file",
+}
+
+
+class TestGitSubmodules(unittest.TestCase):
+    """Test the git submodule helpers."""
+
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name)
+
+        git_env = local.env(**GIT_ENV)
+        git_env.__enter__()
+        self.addCleanup(git_env.__exit__, None, None, None)
+
+        self.gnulib_remote = self.tmp_path / "gnulib_remote"
+        git("init", "-q", str(self.gnulib_remote))
+        with local.cwd(self.gnulib_remote):
+            git("commit", "-q", "--allow-empty", "-m", "gnulib")
+
+        project_repo = self.tmp_path / "project_remote"
+        git("init", "-q", str(project_repo))
+        with local.cwd(project_repo):
+            git(
+                "-c", "protocol.file.allow=always", "submodule", "add", "-q",
+                str(self.gnulib_remote), "gnulib"
+            )
+            git("commit", "-q", "-m", "project")
+
+        self.project = self.tmp_path / "project"
+        git("clone", "-q", str(project_repo), str(self.project))
+
+        self.prefix = self.tmp_path / "prefix"
+        prefix_patch = mock.patch.object(
+            project_util, "target_prefix", return_value=str(self.prefix)
+        )
+        prefix_patch.start()
+        self.addCleanup(prefix_patch.stop)
+
+    def __patch_gnulib_remote(self, remote: Path) -> tp.Any:
+        return mock.patch.object(
+            project_util, "_GNULIB_SOURCE",
+            Git(remote=str(remote), local="gnulib", limit=None, shallow=False)
+        )
+
+    def test_update_with_gnulib_reference(self) -> None:
+        """Check if submodules are checked out from the shared clone without
+        depending on it afterwards."""
+        with self.__patch_gnulib_remote(self.gnulib_remote), \
+                mock.patch("benchbuild.source.base.target_prefix",
+                           return_value=str(self.prefix)), \
+                local.cwd(self.project):
+            reference = get_gnulib_reference_path()
+            self.assertEqual(self.prefix / "gnulib", reference)
+
+            update_git_submodules(2, reference=reference)
+
+            self.assertTrue((self.project / "gnulib" / ".git").exists())
+            alternates = Path(
+                git(
+                    "-C", "gnulib", "rev-parse", "--git-path",
+                    "objects/info/alternates"
+                ).strip()
+            )
+            if not alternates.is_absolute():
+                alternates = self.project / "gnulib" / alternates
+            self.assertFalse(alternates.exists())
+
+    def test_update_without_reachable_gnulib(self) -> None:
+        """Check if submodules are still updated if no reference can be
+        created."""
+        with self.__patch_gnulib_remote(self.tmp_path / "missing"), \
+                mock.patch("benchbuild.source.base.target_prefix",
+                           return_value=str(self.prefix)), \
+                local.cwd(self.project):
+            reference = get_gnulib_reference_path()
+            self.assertIsNone(reference)
+
+            update_git_submodules(2, reference=self.tmp_path / "missing")
+
+            self.assertTrue((self.project / "gnulib" / ".git").exists())
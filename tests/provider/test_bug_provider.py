@@ -1,22 +1,57 @@
 """Test bug_provider and bug modules."""
+import pickle
 import unittest
-from unittest.mock import create_autospec
+from unittest.mock import create_autospec, patch
 
 import pygit2
 from github.Issue import Issue
 from github.IssueEvent import IssueEvent
 from github.Label import Label
 
+import varats.provider.bug.bug as bug
 from varats.provider.bug.bug import (
+    RawBug,
     _has_closed_a_bug,
     _search_corresponding_pygit_bug,
+    find_all_raw_bugs,
+    find_raw_bug_by_fix,
 )
 
 
+def create_bug_closing_event(issue_number: int, commit_id: str) -> IssueEvent:
+    """Create a mock issue event closing a bug related issue."""
+    bug_label = create_autospec(Label)
+    bug_label.name = "bug"
+
+    issue = create_autospec(Issue)
+    issue.number = issue_number
+    issue.labels = [bug_label]
+
+    issue_event = create_autospec(IssueEvent)
+    issue_event.event = "closed"
+    issue_event.commit_id = commit_id
+    issue_event.issue = issue
+    return issue_event
+
+
+def create_repo_mock(head_commit: str) -> pygit2.Repository:
+    """Create a mock repository with the given HEAD commit."""
+    repo = create_autospec(pygit2.Repository)
+    repo.head.target = head_commit
+    return repo
+
+
 class TestBugDetectionStrategies(unittest.TestCase):
     """Test several parts of the bug detection strategies used by the
     BugProvider."""
 
+    def setUp(self):
+        # bug queries are cached per project name
+        find_all_raw_bugs.cache_clear()
+        # pylint: disable=protected-access
+        bug._get_raw_bugs_by_fixing_commit.cache_clear()
+        bug._get_raw_bugs_by_introducing_commit.cache_clear()
+
     def test_issue_events_closing_bug(self):
         """Test identifying issue events that close a bug related issue, with
         and without associated commit id."""
@@ -116,3 +151,57 @@ class TestBugDetectionStrategies(unittest.TestCase):
 
         self.assertEqual(pybug.fixing_commit.hex, issue_event.commit_id)
         self.assertEqual(pybug.issue_id, issue_event.issue.number)
+
+    def test_find_raw_bug_by_fix(self):
+        """Test whether only bugs fixed by the given commit are found."""
+        issue_events = [
+            create_bug_closing_event(5, "1238"),
+            create_bug_closing_event(6, "1239")
+        ]
+
+        with patch(
+            "varats.provider.bug.bug._get_all_issue_events",
+            return_value=issue_events
+        ), patch(
+            "varats.provider.bug.bug._get_project_repo",
+            return_value=create_repo_mock("1300")
+        ):
+            rawbugs = find_raw_bug_by_fix("test_project", "1239")
+
+        self.assertEqual(1, len(rawbugs))
+        rawbug = next(iter(rawbugs))
+        self.assertEqual("1239", rawbug.fixing_commit)
+        self.assertEqual(6, rawbug.issue_id)
+
+    def test_find_all_raw_bugs_cached(self):
+        """Test whether the bugs of a project are only computed once."""
+        with patch(
+            "varats.provider.bug.bug._get_project_repo",
+            return_value=create_repo_mock("1301")
+        ), patch(
+            "varats.provider.bug.bug._get_all_issue_events",
+            return_value=[create_bug_closing_event(8, "1242")]
+        ) as issue_events_mock:
+            rawbugs = find_all_raw_bugs("test_project")
+            self.assertEqual(frozenset([RawBug("1242", [], 8)]), rawbugs)
+            self.assertIs(rawbugs, find_all_raw_bugs("test_project"))
+            issue_events_mock.assert_called_once()
+
+    def test_raw_bug_equality(self):
+        """Test that equal RawBugs are merged in sets."""
+        rawbug = RawBug("1240", ["1241"], 7)
+        same_rawbug = RawBug("1240", ["1241"], 7)
+        other_rawbug = RawBug("1240", [], 7)
+
+        self.assertEqual(rawbug, same_rawbug)
+        self.assertEqual(hash(rawbug), hash(same_rawbug))
+        self.assertNotEqual(rawbug, other_rawbug)
+        self.assertEqual(2, len(frozenset([rawbug, same_rawbug, other_rawbug])))
+
+    def test_raw_bug_pickling(self):
+        """Test that unpickled RawBugs are equal to the original ones."""
+        rawbug = RawBug("1243", ["1244"], 9)
+        unpickled_rawbug = pickle.loads(pickle.dumps(rawbug))
+
+        self.assertEqual(rawbug, unpickled_rawbug)
+        self.assertEqual(hash(rawbug), hash(unpickled_rawbug))
@@ -1,9 +1,12 @@
 """Test github utilities."""
+import threading
 import typing as tp
 import unittest
+from unittest import mock
 
 from github import Github, PaginatedList
 from github.GithubObject import GithubObject, NonCompletableGithubObject
+from github.PaginatedList import PaginatedList as PaginatedListClass
 from github.PaginatedList import PaginatedListBase
 
 from tests.test_utils import replace_config
@@ -48,6 +51,27 @@ class DummyPaginatedList(PaginatedListBase):
         return self.__items
 
 
+class DummyMultiPagePaginatedList(PaginatedListClass):
+    """Dummy PaginatedList class with one object per page."""
+
+    # pylint: disable=super-init-not-called
+    def __init__(
+        self, github: Github, num_pages: int,
+        used_lists: tp.List[tp.Tuple['DummyMultiPagePaginatedList', int]]
+    ) -> None:
+        self.__github = github
+        self.__num_pages = num_pages
+        self.__used_lists = used_lists
+
+    @property
+    def totalCount(self) -> int:  # pylint: disable=invalid-name
+        return self.__num_pages * self.__github.per_page
+
+    def get_page(self, page: int) -> tp.List[GithubObject]:
+        self.__used_lists.append((self, threading.get_ident()))
+        return [DummyGithubObject(None, {}, {"page": page}, True)]
+
+
 class TestGithubObjectCache(unittest.TestCase):
     """Test the GithubObjectCache."""
 
@@ -92,3 +116,36 @@ class TestGithubObjectCache(unittest.TestCase):
             cached_list = _get_cached_pygithub_object_list("demo_github_list")
             self.assertIsNotNone(cached_list)
             self.assertEqual(3, len(cached_list))
+
+    def test_cache_multi_page_paginated_list(self):
+        """Test caching a PaginatedList with concurrently fetched pages."""
+        num_pages = 20
+        used_lists: tp.List[tp.Tuple[DummyMultiPagePaginatedList, int]] = []
+
+        def load_github_list(github: Github) -> PaginatedList:
+            return DummyMultiPagePaginatedList(github, num_pages, used_lists)
+
+        with replace_config(), mock.patch(
+            "varats.utils.github_util.get_github_instance",
+            side_effect=lambda: Github()
+        ):
+            github_object_list = get_cached_github_object_list(
+                "demo_github_multi_page_list", load_github_list
+            )
+            cached_list = _get_cached_pygithub_object_list(
+                "demo_github_multi_page_list"
+            )
+
+        expected_pages = [{"page": page} for page in range(num_pages)]
+        self.assertEqual(
+            expected_pages, [obj.raw_data for obj in github_object_list]
+        )
+        self.assertEqual(expected_pages, [obj.raw_data for obj in cached_list])
+        # every list, and thus every Github instance, is only used by one
+        # thread
+        threads_per_list: tp.Dict[int, tp.Set[int]] = {}
+        for paginated_list, thread_id in used_lists:
+            threads_per_list.setdefault(id(paginated_list),
+                                        set()).add(thread_id)
+        for thread_ids in threads_per_list.values():
+            self.assertEqual(1, len(thread_ids))
@@ -0,0 +1,70 @@
+"""Test yaml utilities."""
+import unittest
+from unittest import mock
+
+import yaml
+
+from varats.utils.yaml_util import load_plain_yaml_documents
+
+YAML_DOCS = """---
+DocType:         CommitReport
+Version:         3
+...
+---
+function-info:
+  - id:              bi_init
+    region-id:       0123
+    function-name:   bi_init
+region-mapping:
+call-graph-edges: []
+no-values: [~, null, "", '~', !!str null]
+nested:
+  - - a
+    - b
+  - key: {inner: 1.5}
+...
+"""
+
+
+class TestLoadPlainYamlDocuments(unittest.TestCase):
+    """Test plain yaml document loading."""
+
+    def test_matches_safe_loader_without_typed_scalars(self) -> None:
+        """Check if documents are loaded like with the yaml SafeLoader, apart
+        from scalars that SafeLoader converts to other types than None."""
+        documents = list(load_plain_yaml_documents(YAML_DOCS))
+        documents[0]['Version'] = 3
+        documents[1]['function-info'][0]['region-id'] = 83
+        documents[1]['nested'][1]['key']['inner'] = 1.5
+
+        self.assertEqual(
+            documents, list(yaml.load_all(YAML_DOCS, Loader=yaml.SafeLoader))
+        )
+
+    def test_pure_python_parser(self) -> None:
+        """Check if documents are loaded the same way without libyaml."""
+        with mock.patch("varats.utils.yaml_util._YamlParser", yaml.BaseLoader):
+            documents = list(load_plain_yaml_documents(YAML_DOCS))
+
+        self.assertEqual(documents, list(load_plain_yaml_documents(YAML_DOCS)))
+
+    def test_scalars_are_strings(self) -> None:
+        """Check if scalars are not converted to other types."""
+        documents = load_plain_yaml_documents(YAML_DOCS)
+
+        self.assertEqual(next(documents)['Version'], '3')
+        body = next(documents)
+        self.assertEqual(body['function-info'][0]['region-id'], '0123')
+        self.assertEqual(body['call-graph-edges'], [])
+
+    def test_null_scalars(self) -> None:
+        """Check if only untagged plain null scalars are loaded as None."""
+        body = list(load_plain_yaml_documents(YAML_DOCS))[1]
+
+        self.assertIsNone(body['region-mapping'])
+        self.assertEqual(body['no-values'], [None, None, '', '~', 'null'])
+
+    def test_aliases_are_rejected(self) -> None:
+        """Check if aliases raise an error."""
+        with self.assertRaises(yaml.YAMLError):
+            list(load_plain_yaml_documents("---\na: &x 1\nb: *x\n"))
@@ -27,6 +27,10 @@ class CommitMap():
             slices = line.strip().split(', ')
             self.__hash_to_id[slices[1]] = int(slices[0])
 
+        # short hashes resolve via a prefix search of the trie, which plots
+        # repeat for the same hashes, so resolved ids are memoized
+        self.__short_hash_to_id: tp.Dict[str, int] = dict()
+
     def time_id(self, c_hash: str) -> int:
         """
         Convert a commit hash to a time id that allows a total order on the
@@ -56,11 +60,16 @@ class CommitMap():
         Returns:
             unique time-ordered id
         """
+        if c_hash in self.__short_hash_to_id:
+            return self.__short_hash_to_id[c_hash]
+
         subtrie = self.__hash_to_id.items(prefix=c_hash)
         if subtrie:
             if len(subtrie) > 1:
                 LOG.warning(f"Short commit hash is ambiguous: {c_hash}.")
-            return tp.cast(int, subtrie[0][1])
+            time_id = tp.cast(int, subtrie[0][1])
+            self.__short_hash_to_id[c_hash] = time_id
+            return time_id
         raise KeyError
 
     def c_hash(self, time_id: int) -> str:
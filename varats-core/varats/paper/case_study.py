@@ -4,6 +4,8 @@ analysed for a project."""
 import typing as tp
 from pathlib import Path
 
+from pygtrie import CharTrie
+
 from varats.base.configuration import Configuration
 from varats.base.sampling_method import (
     NormalSamplingMethod,
@@ -97,6 +99,10 @@ class CSStage():
         self.__release_type: tp.Optional[ReleaseType] = release_type
         self.__revisions: tp.List[CSEntry
                                  ] = revisions if revisions is not None else []
+        # trie of all commit hashes for fast lookups of (short) revisions
+        self.__revision_trie = CharTrie()
+        for entry in self.__revisions:
+            self.__revision_trie[entry.commit_hash] = True
 
     @property
     def revisions(self) -> tp.List[str]:
@@ -144,11 +150,7 @@ class CSStage():
             ``True``, in case the revision is part of the case study,
             ``False`` otherwise.
         """
-        for cs_revision in self.__revisions:
-            if cs_revision.commit_hash.startswith(revision):
-                return True
-
-        return False
+        return bool(self.__revision_trie.has_node(revision))
 
     def add_revision(
         self,
@@ -166,6 +168,7 @@ class CSStage():
         """
         if not self.has_revision(revision):
             self.__revisions.append(CSEntry(revision, commit_id, config_ids))
+            self.__revision_trie[revision] = True
 
     def get_config_ids_for_revision(self, revision: str) -> tp.List[int]:
         """
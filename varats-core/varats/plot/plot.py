@@ -20,6 +20,10 @@ class PlotDataEmpty(Exception):
 class Plot(metaclass=PlotRegistry):
     """An abstract base class for all plots generated by VaRA-TS."""
 
+    # file types that matplotlib stores as vector graphics, i.e., where a dpi
+    # only affects rasterized artists
+    VECTOR_FILE_TYPES = frozenset(('svg', 'svgz', 'pdf', 'eps', 'ps'))
+
     def __init__(self, name: str, **kwargs: tp.Any) -> None:
         self.__name = name
         self.__style = "classic"
@@ -118,7 +122,10 @@ class Plot(metaclass=PlotRegistry):
         return f"{plot_ident}{self.name}{sep_stages}.{filetype}"
 
     def save(
-        self, path: tp.Optional[Path] = None, filetype: str = 'svg'
+        self,
+        path: tp.Optional[Path] = None,
+        filetype: str = 'svg',
+        dpi: tp.Optional[int] = None
     ) -> None:
         """
         Save the current plot to a file.
@@ -126,6 +133,8 @@ class Plot(metaclass=PlotRegistry):
         Args:
             path: The path where the file is stored (excluding the file name).
             filetype: The file type of the plot.
+            dpi: The resolution for raster file types; vector file types are
+                 stored without a fixed resolution unless one is given.
         """
         try:
             self.plot(False)
@@ -139,11 +148,18 @@ class Plot(metaclass=PlotRegistry):
             plot_dir = path
 
         # TODO (se-passau/VaRA#545): refactor dpi into plot_config.
+        if dpi is None and filetype not in self.VECTOR_FILE_TYPES:
+            dpi = 1200
+
+        savefig_kwargs: tp.Dict[str, tp.Any] = {}
+        if dpi is not None:
+            savefig_kwargs['dpi'] = dpi
+
         plt.savefig(
             plot_dir / self.plot_file_name(filetype),
-            dpi=1200,
             bbox_inches="tight",
-            format=filetype
+            format=filetype,
+            **savefig_kwargs
         )
         plt.close()
 
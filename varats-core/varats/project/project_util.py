@@ -1,4 +1,7 @@
 """Utility module for BenchBuild project handling."""
+import fcntl
+import functools
+import logging
 import typing as tp
 from enum import Enum
 from pathlib import Path
@@ -9,7 +12,9 @@ import pygit2
 from benchbuild.source import Git
 from benchbuild.source.base import target_prefix
 from benchbuild.utils.cmd import cp, find, git, mkdir
-from plumbum import local
+from plumbum import local, ProcessExecutionError
+
+LOG = logging.getLogger(__name__)
 
 
 def get_project_cls_by_name(
@@ -53,6 +58,13 @@ def get_local_project_git(project_name: str) -> pygit2.Repository:
 
 def get_tagged_commits(project_name: str) -> tp.List[tp.Tuple[str, str]]:
     """Get a list of all tagged commits along with their respective tags."""
+    return list(_get_tagged_commits(project_name))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tagged_commits(project_name: str) -> tp.Tuple[tp.Tuple[str, str], ...]:
+    """Look up the tagged commits of a project once and cache them per
+    project."""
     repo_loc = get_local_project_git_path(project_name)
     with local.cwd(repo_loc):
         # --dereference resolves tag IDs into commits
@@ -64,7 +76,7 @@ def get_tagged_commits(project_name: str) -> tp.List[tp.Tuple[str, str]]:
             (ref_split[0], ref_split[1][10:-3])
             for ref_split in [ref.strip().split() for ref in ref_list]
         ]
-        return refs
+        return tuple(refs)
 
 
 def get_all_revisions_between(c_start: str,
@@ -91,6 +103,109 @@ def get_all_revisions_between(c_start: str,
     return list(map(lambda rev: rev[:10], result)) if short else result
 
 
+_GNULIB_SOURCE = Git(
+    remote="https://git.savannah.gnu.org/git/gnulib.git",
+    local="gnulib",
+    refspec="HEAD",
+    limit=None,
+    shallow=False
+)
+
+
+def _get_pinned_submodule_commit(submodule_path: str) -> tp.Optional[str]:
+    """
+    Get the commit a submodule is pinned to by the repository in the current
+    working directory.
+
+    Args:
+        submodule_path: path of the submodule inside the repository
+
+    Returns:
+        the pinned commit hash or ``None``, if there is no such submodule
+    """
+    # gitlinks are listed with the mode 160000
+    for entry in git("ls-files", "--stage", "--", submodule_path).splitlines():
+        mode, commit_hash = entry.split()[:2]
+        if mode == "160000":
+            return tp.cast(str, commit_hash)
+    return None
+
+
+def get_gnulib_reference_path() -> tp.Optional[Path]:
+    """
+    Get the path to a local gnulib clone that is shared between all projects
+    that bootstrap with gnulib, for the repository in the current working
+    directory.
+
+    The clone is downloaded on first use and only fetched again if it does not
+    contain the gnulib commit pinned by the repository. Access to the clone is
+    serialized with a file lock, so parallel builds do not race on it. The
+    reference is best-effort: if it cannot be created or updated, e.g., because
+    the gnulib server is unreachable, an existing but outdated clone is still
+    returned, otherwise ``None``.
+
+    Returns:
+        the path to the shared gnulib clone or ``None``, if the repository
+        pins no gnulib submodule or no clone is available
+    """
+    pinned_commit = _get_pinned_submodule_commit("gnulib")
+    if pinned_commit is None:
+        return None
+
+    gnulib_path = Path(target_prefix()) / _GNULIB_SOURCE.local
+    gnulib_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(gnulib_path.with_suffix(".lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            _GNULIB_SOURCE.fetch()
+            with local.cwd(gnulib_path):
+                retcode, _, _ = git["cat-file", "-e",
+                                    f"{pinned_commit}^{{commit}}"].run(
+                                        retcode=None
+                                    )
+                if retcode != 0:
+                    git("fetch", "--quiet", "origin")
+        except ProcessExecutionError as error:
+            LOG.warning(f"Could not update the gnulib reference: {error}")
+
+    if (gnulib_path / ".git").exists():
+        return gnulib_path
+    return None
+
+
+def update_git_submodules(
+    jobs: int, reference: tp.Optional[Path] = None
+) -> None:
+    """
+    Initialize and update all git submodules of the repository in the current
+    working directory, fetching up to ``jobs`` submodules in parallel.
+
+    The submodules are checked out at the exact commits pinned by the
+    repository, so their history is kept complete. Objects borrowed from a
+    reference repository are copied into the submodules, so they do not depend
+    on the reference afterwards. If the update with the reference fails, it is
+    retried without it.
+
+    Args:
+        jobs: number of submodules to fetch in parallel
+        reference: local repository to borrow objects from
+    """
+    update_args = [
+        "submodule", "update", "--init", "--recursive", "--jobs",
+        str(max(1, jobs))
+    ]
+    if reference:
+        try:
+            git(*update_args, "--reference", str(reference), "--dissociate")
+            return
+        except ProcessExecutionError as error:
+            LOG.warning(
+                f"Updating submodules with reference {reference} failed, "
+                f"retrying without it: {error}"
+            )
+    git(*update_args)
+
+
 class BinaryType(Enum):
     """Enum for different binary types."""
     value: int
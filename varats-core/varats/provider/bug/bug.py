@@ -1,6 +1,8 @@
 """Bug Classes used by bug_provider."""
 
+import functools
 import typing as tp
+from collections import defaultdict
 
 import pygit2
 from github import Github
@@ -25,6 +27,24 @@ class PygitBug:
         self.__fixing_commit = fixing_commit
         self.__introducing_commits = introducing_commits
         self.__issue_id = issue_id
+        # bugs are immutable, so the hash only needs to be computed once
+        self.__hash = hash(self.__key())
+
+    def __key(self) -> tp.Tuple[pygit2.Oid, tp.Tuple[pygit2.Oid, ...], int]:
+        return (
+            self.__fixing_commit.id,
+            tuple(commit.id for commit in self.__introducing_commits),
+            self.__issue_id
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PygitBug):
+            return False
+        # pylint: disable=protected-access
+        return self.__key() == other.__key()
+
+    def __hash__(self) -> int:
+        return self.__hash
 
     @property
     def fixing_commit(self) -> pygit2.Commit:
@@ -52,6 +72,32 @@ class RawBug:
         self.__fixing_commit = fixing_commit
         self.__introducing_commits = introducing_commits
         self.__issue_id = issue_id
+        # bugs are immutable, so the hash only needs to be computed once
+        self.__hash = hash(self.__key())
+
+    def __key(self) -> tp.Tuple[str, tp.Tuple[str, ...], int]:
+        return (
+            self.__fixing_commit, tuple(self.__introducing_commits),
+            self.__issue_id
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RawBug):
+            return False
+        # pylint: disable=protected-access
+        return self.__key() == other.__key()
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __reduce__(
+        self
+    ) -> tp.Tuple[tp.Type['RawBug'], tp.Tuple[str, tp.List[str], int]]:
+        # recreate the bug on unpickling, as string hashes differ between runs
+        return (
+            RawBug,
+            (self.__fixing_commit, self.__introducing_commits, self.__issue_id)
+        )
 
     @property
     def fixing_commit(self) -> str:
@@ -89,10 +135,31 @@ def _has_closed_a_bug(issue_event: IssueEvent) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=None)
+def _get_project_repo(project_name: str) -> pygit2.Repository:
+    """
+    Opens the local git repository of a project.
+
+    The repository handle is cached, so repeated lookups for the same project
+    neither re-fetch the project source nor re-open the repository.
+
+    Args:
+        project_name: The name of the project to look in.
+
+    Returns:
+        The pygit2 Repository of the project.
+    """
+    return get_local_project_git(project_name)
+
+
+@functools.lru_cache(maxsize=None)
 def _get_all_issue_events(project_name: str) -> tp.List[IssueEvent]:
     """
     Loads and returns all issue events for a given project.
 
+    The loaded events are cached per project, so successive bug queries do not
+    deserialize the github cache again.
+
     Args:
         project_name: The name of the project to look in.
 
@@ -116,18 +183,18 @@ def _get_all_issue_events(project_name: str) -> tp.List[IssueEvent]:
     return []
 
 
-def _search_corresponding_pygit_bug(
+def _search_corresponding_raw_bug(
     issue_event: IssueEvent, project_repo: pygit2.Repository
-) -> tp.Optional[PygitBug]:
+) -> tp.Optional[RawBug]:
     """
-    Returns the PygitBug corresponding to a given IssueEvent, if there is one.
+    Returns the RawBug corresponding to a given IssueEvent, if there is one.
 
     Args:
         issue_event: The Github IssueEvent potentially related to a bug
         project_repo: The related pygit2 project Repository
 
     Returns:
-        A PygitBug Object or None.
+        A RawBug Object or None.
     """
     if _has_closed_a_bug(issue_event):
         fixing_id = issue_event.commit_id
@@ -136,74 +203,93 @@ def _search_corresponding_pygit_bug(
             return None
         # unwrap option type
         fixing_id_string: str = fixing_id
-        fixing_pycommit: pygit2.Commit = project_repo.revparse_single(
-            fixing_id_string
-        )
 
-        introducing_pycommits: tp.List[pygit2.Commit] = []
+        introducing_ids: tp.List[str] = []
+
         # TODO find introducing commits
 
-        return PygitBug(
-            fixing_pycommit, introducing_pycommits, issue_event.issue.number
+        return RawBug(
+            fixing_id_string, introducing_ids, issue_event.issue.number
         )
     return None
 
 
-def _search_corresponding_raw_bug(
-    issue_event: IssueEvent, project_repo: pygit2.Repository
-) -> tp.Optional[RawBug]:
+def _as_pygit_bug(raw_bug: RawBug, project_repo: pygit2.Repository) -> PygitBug:
     """
-    Returns the RawBug corresponding to a given IssueEvent, if there is one.
+    Converts a RawBug into the corresponding PygitBug by looking up its commits.
 
     Args:
-        issue_event: The Github IssueEvent potentially related to a bug
+        raw_bug: The RawBug to convert
         project_repo: The related pygit2 project Repository
 
     Returns:
-        A RawBug Object or None.
+        A PygitBug Object.
     """
-    if _has_closed_a_bug(issue_event):
-        fixing_id = issue_event.commit_id
+    fixing_pycommit: pygit2.Commit = project_repo.revparse_single(
+        raw_bug.fixing_commit
+    )
+    introducing_pycommits: tp.List[pygit2.Commit] = [
+        project_repo.revparse_single(introducing_id)
+        for introducing_id in raw_bug.introducing_commits
+    ]
+    return PygitBug(fixing_pycommit, introducing_pycommits, raw_bug.issue_id)
 
-        if fixing_id is None:
-            return None
-        # unwrap option type
-        fixing_id_string: str = fixing_id
 
-        introducing_ids: tp.List[str] = []
+@functools.lru_cache(maxsize=16384)
+def _get_corresponding_pygit_bug(
+    project_name: str, raw_bug: RawBug
+) -> PygitBug:
+    """
+    Returns the PygitBug corresponding to a RawBug of a project.
 
-        # TODO find introducing commits
+    Converted bugs are cached, so repeated queries do not look up the same
+    commits again.
 
-        return RawBug(
-            fixing_id_string, introducing_ids, issue_event.issue.number
-        )
-    return None
+    Args:
+        project_name: Name of the project the bug belongs to
+        raw_bug: The RawBug to convert
 
+    Returns:
+        A PygitBug Object.
+    """
+    return _as_pygit_bug(raw_bug, _get_project_repo(project_name))
 
-def _filter_pygit_bugs_for_all_issue_events(
-    project_name: str, issue_filter_function: tp.Callable[[IssueEvent],
-                                                          tp.Optional[PygitBug]]
-) -> tp.FrozenSet[PygitBug]:
+
+def _as_pygit_bugs(project_name: str,
+                   raw_bugs: tp.FrozenSet[RawBug]) -> tp.FrozenSet[PygitBug]:
     """
-    Wrapper function that uses given function to filter out a certain type of
-    PygitBugs.
+    Converts a set of RawBugs into the corresponding PygitBugs.
 
     Args:
-        project_name: Name of the project to draw the issue events out of.
-        issue_filter_function: Function that determines for an issue event
-            whether it produces an acceptable PygitBug or not.
+        project_name: Name of the project the bugs belong to
+        raw_bugs: The RawBugs to convert
 
     Returns:
-        The set of PygitBugs accepted by the filtering method.
+        The set of corresponding PygitBugs.
     """
-    resulting_pygit_bugs = set()
+    return frozenset(
+        _get_corresponding_pygit_bug(project_name, rawbug)
+        for rawbug in raw_bugs
+    )
 
-    issue_events = _get_all_issue_events(project_name)
-    for issue_event in issue_events:
-        pybug = issue_filter_function(issue_event)
-        if pybug:
-            resulting_pygit_bugs.add(pybug)
-    return frozenset(resulting_pygit_bugs)
+
+def _search_corresponding_pygit_bug(
+    issue_event: IssueEvent, project_repo: pygit2.Repository
+) -> tp.Optional[PygitBug]:
+    """
+    Returns the PygitBug corresponding to a given IssueEvent, if there is one.
+
+    Args:
+        issue_event: The Github IssueEvent potentially related to a bug
+        project_repo: The related pygit2 project Repository
+
+    Returns:
+        A PygitBug Object or None.
+    """
+    rawbug = _search_corresponding_raw_bug(issue_event, project_repo)
+    if rawbug:
+        return _as_pygit_bug(rawbug, project_repo)
+    return None
 
 
 def _filter_raw_bugs_for_all_issue_events(
@@ -222,14 +308,10 @@ def _filter_raw_bugs_for_all_issue_events(
     Returns:
         The set of RawBugs accepted by the filtering method.
     """
-    resulting_raw_bugs = set()
-
     issue_events = _get_all_issue_events(project_name)
-    for issue_event in issue_events:
-        rawbug = issue_filter_function(issue_event)
-        if rawbug:
-            resulting_raw_bugs.add(rawbug)
-    return frozenset(resulting_raw_bugs)
+    return frozenset(
+        rawbug for rawbug in map(issue_filter_function, issue_events) if rawbug
+    )
 
 
 def find_all_pygit_bugs(project_name: str) -> tp.FrozenSet[PygitBug]:
@@ -242,29 +324,25 @@ def find_all_pygit_bugs(project_name: str) -> tp.FrozenSet[PygitBug]:
     Returns:
         A set of PygitBugs.
     """
-
-    def accept_all_pybugs(issue_event: IssueEvent) -> tp.Optional[PygitBug]:
-        pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-        return _search_corresponding_pygit_bug(issue_event, pygit_repo)
-
-    return _filter_pygit_bugs_for_all_issue_events(
-        project_name, accept_all_pybugs
-    )
+    return _as_pygit_bugs(project_name, find_all_raw_bugs(project_name))
 
 
+@functools.lru_cache(maxsize=None)
 def find_all_raw_bugs(project_name: str) -> tp.FrozenSet[RawBug]:
     """
     Creates a set of all bugs.
 
+    The set is computed once per project and reused by subsequent calls.
+
     Args:
         project_name: Name of the project in which to search for bugs
 
     Returns:
         A set of RawBugs.
     """
+    pygit_repo: pygit2.Repository = _get_project_repo(project_name)
 
     def accept_all_rawbugs(issue_event: IssueEvent) -> tp.Optional[RawBug]:
-        pygit_repo: pygit2.Repository = get_local_project_git(project_name)
         return _search_corresponding_raw_bug(issue_event, pygit_repo)
 
     return _filter_raw_bugs_for_all_issue_events(
@@ -272,6 +350,54 @@ def find_all_raw_bugs(project_name: str) -> tp.FrozenSet[RawBug]:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_raw_bugs_by_fixing_commit(
+    project_name: str
+) -> tp.Dict[str, tp.FrozenSet[RawBug]]:
+    """
+    Groups all RawBugs of a project by their fixing commit.
+
+    Args:
+        project_name: Name of the project in which to search for bugs
+
+    Returns:
+        A dict mapping fixing commit hashes to the RawBugs they fix.
+    """
+    raw_bugs_by_fix: tp.DefaultDict[str, tp.Set[RawBug]] = defaultdict(set)
+    for rawbug in find_all_raw_bugs(project_name):
+        raw_bugs_by_fix[rawbug.fixing_commit].add(rawbug)
+
+    return {
+        fixing_commit: frozenset(raw_bugs)
+        for fixing_commit, raw_bugs in raw_bugs_by_fix.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_raw_bugs_by_introducing_commit(
+    project_name: str
+) -> tp.Dict[str, tp.FrozenSet[RawBug]]:
+    """
+    Groups all RawBugs of a project by their introducing commits.
+
+    Args:
+        project_name: Name of the project in which to search for bugs
+
+    Returns:
+        A dict mapping introducing commit hashes to the RawBugs they introduce.
+    """
+    raw_bugs_by_introduction: tp.DefaultDict[str,
+                                             tp.Set[RawBug]] = defaultdict(set)
+    for rawbug in find_all_raw_bugs(project_name):
+        for introducing_commit in rawbug.introducing_commits:
+            raw_bugs_by_introduction[introducing_commit].add(rawbug)
+
+    return {
+        introducing_commit: frozenset(raw_bugs)
+        for introducing_commit, raw_bugs in raw_bugs_by_introduction.items()
+    }
+
+
 def find_pygit_bug_by_fix(project_name: str,
                           fixing_commit: str) -> tp.FrozenSet[PygitBug]:
     """
@@ -284,22 +410,8 @@ def find_pygit_bug_by_fix(project_name: str,
     Returns:
         A set of PygitBugs fixed by fixing_commit
     """
-
-    def accept_pybug_with_certain_fix(
-        issue_event: IssueEvent
-    ) -> tp.Optional[PygitBug]:
-        pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-        pybug: tp.Optional[PygitBug] = _search_corresponding_pygit_bug(
-            issue_event, pygit_repo
-        )
-
-        if pybug:
-            if pybug.fixing_commit.hex is fixing_commit:
-                return pybug
-        return None
-
-    return _filter_pygit_bugs_for_all_issue_events(
-        project_name, accept_pybug_with_certain_fix
+    return _as_pygit_bugs(
+        project_name, find_raw_bug_by_fix(project_name, fixing_commit)
     )
 
 
@@ -315,23 +427,8 @@ def find_raw_bug_by_fix(project_name: str,
     Returns:
         A set of RawBugs fixed by fixing_commit
     """
-
-    def accept_rawbug_with_certain_fix(
-        issue_event: IssueEvent
-    ) -> tp.Optional[RawBug]:
-        pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-        rawbug: tp.Optional[RawBug] = _search_corresponding_raw_bug(
-            issue_event, pygit_repo
-        )
-
-        if rawbug:
-            if rawbug.fixing_commit is fixing_commit:
-                return rawbug
-        return None
-
-    return _filter_raw_bugs_for_all_issue_events(
-        project_name, accept_rawbug_with_certain_fix
-    )
+    raw_bugs_by_fix = _get_raw_bugs_by_fixing_commit(project_name)
+    return raw_bugs_by_fix.get(fixing_commit, frozenset())
 
 
 def find_pygit_bug_by_introduction(
@@ -347,24 +444,9 @@ def find_pygit_bug_by_introduction(
     Returns:
         A set of PygitBugs introduced by introducing_commit
     """
-
-    def accept_pybug_with_certain_introduction(
-        issue_event: IssueEvent
-    ) -> tp.Optional[PygitBug]:
-        pygit_repo = get_local_project_git(project_name)
-        pybug: tp.Optional[PygitBug] = _search_corresponding_pygit_bug(
-            issue_event, pygit_repo
-        )
-
-        if pybug:
-            for introducing_pycommit in pybug.introducing_commits:
-                if introducing_pycommit.hex is introducing_commit:
-                    return pybug
-                    # found wanted ID
-        return None
-
-    return _filter_pygit_bugs_for_all_issue_events(
-        project_name, accept_pybug_with_certain_introduction
+    return _as_pygit_bugs(
+        project_name,
+        find_raw_bug_by_introduction(project_name, introducing_commit)
     )
 
 
@@ -381,22 +463,5 @@ def find_raw_bug_by_introduction(
     Returns:
         A set of RawBugs introduced by introducing_commit
     """
-
-    def accept_rawbug_with_certain_introduction(
-        issue_event: IssueEvent
-    ) -> tp.Optional[RawBug]:
-        pygit_repo: pygit2.Repository = get_local_project_git(project_name)
-        rawbug: tp.Optional[RawBug] = _search_corresponding_raw_bug(
-            issue_event, pygit_repo
-        )
-
-        if rawbug:
-            for introducing_id in rawbug.introducing_commits:
-                if introducing_id is introducing_commit:
-                    return rawbug
-                    # found wanted ID
-        return None
-
-    return _filter_raw_bugs_for_all_issue_events(
-        project_name, accept_rawbug_with_certain_introduction
-    )
+    raw_bugs_by_introduction = _get_raw_bugs_by_introducing_commit(project_name)
+    return raw_bugs_by_introduction.get(introducing_commit, frozenset())
@@ -13,6 +13,8 @@ LOG = logging.getLogger(__name__)
 
 GITHUB_URL_PATTERN = re.compile(r"https://github\.com/(.*)/(.*)\.git")
 
+BugType = tp.TypeVar("BugType", bug.PygitBug, bug.RawBug)
+
 
 class BugProvider(Provider):
     """Provides bug information for a project."""
@@ -38,6 +40,25 @@ class BugProvider(Provider):
     ) -> 'BugProvider':
         return BugDefaultProvider(project)
 
+    def __find_bugs(
+        self, find_function: tp.Callable[..., tp.FrozenSet[BugType]], *args: str
+    ) -> tp.FrozenSet[BugType]:
+        """
+        Runs a query of the bug module for the provider's project.
+
+        Args:
+            find_function: the query function taking the github project name
+                           and the given arguments
+            args: additional arguments passed to the query function
+
+        Returns:
+            the bugs found by the query or an empty set if the project is not
+            hosted on github
+        """
+        if self.__github_project_name:
+            return find_function(self.__github_project_name, *args)
+        return frozenset()
+
     def find_all_pygit_bugs(self) -> tp.FrozenSet[bug.PygitBug]:
         """
         Creates a set for all bugs of the provider's project.
@@ -45,9 +66,7 @@ class BugProvider(Provider):
         Returns:
             A set of PygitBugs.
         """
-        if self.__github_project_name:
-            return bug.find_all_pygit_bugs(self.__github_project_name)
-        return frozenset()
+        return self.__find_bugs(bug.find_all_pygit_bugs)
 
     def find_all_raw_bugs(self) -> tp.FrozenSet[bug.RawBug]:
         """
@@ -56,9 +75,7 @@ class BugProvider(Provider):
         Returns:
             A set of RawBugs.
         """
-        if self.__github_project_name:
-            return bug.find_all_raw_bugs(self.__github_project_name)
-        return frozenset()
+        return self.__find_bugs(bug.find_all_raw_bugs)
 
     def find_pygit_bug_by_fix(self,
                               fixing_commit: str) -> tp.FrozenSet[bug.PygitBug]:
@@ -72,11 +89,7 @@ class BugProvider(Provider):
         Returns:
             A set of PygitBugs fixed by fixing_commit
         """
-        if self.__github_project_name:
-            return bug.find_pygit_bug_by_fix(
-                self.__github_project_name, fixing_commit
-            )
-        return frozenset()
+        return self.__find_bugs(bug.find_pygit_bug_by_fix, fixing_commit)
 
     def find_raw_bug_by_fix(self,
                             fixing_commit: str) -> tp.FrozenSet[bug.RawBug]:
@@ -90,11 +103,7 @@ class BugProvider(Provider):
         Returns:
             A set of RawBugs fixed by fixing_commit
         """
-        if self.__github_project_name:
-            return bug.find_raw_bug_by_fix(
-                self.__github_project_name, fixing_commit
-            )
-        return frozenset()
+        return self.__find_bugs(bug.find_raw_bug_by_fix, fixing_commit)
 
     def find_pygit_bug_by_introduction(
         self, introducing_commit: str
@@ -109,11 +118,9 @@ class BugProvider(Provider):
         Returns:
             A set of PygitBugs introduced by introducing_commit
         """
-        if self.__github_project_name:
-            return bug.find_pygit_bug_by_introduction(
-                self.__github_project_name, introducing_commit
-            )
-        return frozenset()
+        return self.__find_bugs(
+            bug.find_pygit_bug_by_introduction, introducing_commit
+        )
 
     def find_raw_bug_by_introduction(
         self, introducing_commit: str
@@ -128,11 +135,9 @@ class BugProvider(Provider):
         Returns:
             A set of RawBugs introduced by introducing_commit
         """
-        if self.__github_project_name:
-            return bug.find_raw_bug_by_introduction(
-                self.__github_project_name, introducing_commit
-            )
-        return frozenset()
+        return self.__find_bugs(
+            bug.find_raw_bug_by_introduction, introducing_commit
+        )
 
 
 class BugDefaultProvider(BugProvider):
@@ -47,6 +47,12 @@ from varats.provider.cve.cve import (
 
 LOG = logging.getLogger(__name__)
 
+# Includes old CVE format with just 4 numbers at the end, as well as the new
+# one with 8
+__CVE_PATTERN = re.compile(r'CVE-\d{4}-\d{4,8}', re.IGNORECASE)
+__CWE_PATTERN = re.compile(r'CWE-[\d\-]+\d', re.IGNORECASE)
+__TAG_PATTERN = re.compile(r'\(tag:\s*.*\)', re.IGNORECASE)
+
 
 def __n_grams(
     text: str,
@@ -92,13 +98,10 @@ def __collect_via_commit_mgs(
         CVE, CWE]]]] = defaultdict(lambda: defaultdict(set))
 
     for line in commits:
-        line_parts = line.split(' ')
-        commit, message = line_parts[0], ' '.join(line_parts[1:])
+        commit, _, message = line.partition(' ')
         if 'CVE-' in message or 'CWE-' in message:
             # Check commit message for "CVE-XXXX-XXXXXXXX"
-            # Includes old CVE format with just 4 numbers at the end,
-            # as well as the new one with 8
-            cve_list = re.findall(r'CVE-\d{4}-\d{4,8}', message, re.IGNORECASE)
+            cve_list = __CVE_PATTERN.findall(message)
             cve_data = []
             for cve in cve_list:
                 try:
@@ -106,7 +109,7 @@ def __collect_via_commit_mgs(
                 except ValueError as error_msg:
                     LOG.error(error_msg)
             # Check commit message for "CWE-XXXX"
-            cwe_list = re.findall(r'CWE-[\d\-]+\d', message, re.IGNORECASE)
+            cwe_list = __CWE_PATTERN.findall(message)
             cwe_data = []
             for cwe in cwe_list:
                 try:
@@ -152,9 +155,8 @@ def __collect_via_version(
     tag_list: tp.Dict[tp.Union[LegacyVersion, Version], tp.Dict[str,
                                                                 tp.Any]] = {}
     for number, line in enumerate(reversed(commits)):
-        line_parts = line.split(' ')
-        commit, message = line_parts[0], ' '.join(line_parts[1:])
-        tag = re.findall(r'\(tag:\s*.*\)', message, re.IGNORECASE)
+        commit, _, message = line.partition(' ')
+        tag = __TAG_PATTERN.findall(message)
         if tag:
             parsed_tag = parse_version(
                 tag[0].split(' ')[1].replace(',', '').replace(')', '')
@@ -199,7 +201,7 @@ def __collect_via_references(
 
         for referenced_commit in referenced_commits:
             for line in commits:
-                commit = line.split(' ')[0]
+                commit = line.partition(' ')[0]
                 if referenced_commit == commit:
                     results[commit]['cve'].add(cve)
                     break
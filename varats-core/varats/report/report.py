@@ -1,6 +1,7 @@
 """The Report module implements basic report functionalities and provides a
 minimal interface ``BaseReport`` to implement own reports."""
 
+import functools
 import re
 import typing as tp
 from abc import abstractmethod
@@ -164,6 +165,17 @@ class MetaReport(type):
                     "a static variable {var}."
                 ))
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16384)
+    def __match_result_file(file_name: str) -> tp.Optional[tp.Match[str]]:
+        """
+        Match a file name against the result file regex.
+
+        Result file names are checked by several of the accessors below, often
+        for the same files, so the matches are memoized.
+        """
+        return MetaReport.__RESULT_FILE_REGEX.search(file_name)
+
     @staticmethod
     def lookup_report_type_from_file_name(
         file_name: str
@@ -177,7 +189,7 @@ class MetaReport(type):
         Returns:
             corresponding report class
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
+        match = MetaReport.__match_result_file(file_name)
         if match:
             short_hand = match.group("project_shorthand")
             for report_type in MetaReport.REPORT_TYPES.values():
@@ -275,7 +287,7 @@ class MetaReport(type):
             True, if the file name is for a file with the the specified
             ``extension_type``
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
+        match = MetaReport.__match_result_file(file_name)
         if match:
             return match.group("status_ext") == (
                 FileStatusExtension.get_status_extension(extension_type)
@@ -293,7 +305,7 @@ class MetaReport(type):
         Returns:
             True, if the file name is correctly formated
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
+        match = MetaReport.__match_result_file(file_name)
         return match is not None
 
     @staticmethod
@@ -365,7 +377,7 @@ class MetaReport(type):
         Returns:
             the commit hash from a result file name
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
+        match = MetaReport.__match_result_file(file_name)
         if match:
             return match.group("file_commit_hash")
 
@@ -386,7 +398,7 @@ class MetaReport(type):
         Returns:
             the FileStatusExtension of the result file
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
+        match = MetaReport.__match_result_file(file_name)
         if match:
             return FileStatusExtension.get_file_status_from_str(
                 match.group("status_ext")
@@ -489,11 +501,14 @@ class MetaReport(type):
         Returns:
             True, if the file belongs to this report type
         """
-        match = MetaReport.__RESULT_FILE_REGEX.search(file_name)
+        shorthand = str(getattr(cls, "SHORTHAND"))
+        # cheap pre-check to avoid running the regex on unrelated files
+        if not file_name.startswith(shorthand + "-"):
+            return False
+
+        match = MetaReport.__match_result_file(file_name)
         if match:
-            return match.group("project_shorthand") == str(
-                getattr(cls, "SHORTHAND")
-            )
+            return match.group("project_shorthand") == shorthand
         return False
 
 
@@ -501,6 +516,10 @@ class BaseReport(metaclass=MetaReport):
     """Report base class to add general report properties and helper
     functions."""
 
+    # Version of the parsed report objects, increase it when the parsing or the
+    # attributes of a report class change so pickled reports are reparsed.
+    CACHE_VERSION = 1
+
     def __init__(self, path: Path) -> None:
         self.__path = path
 
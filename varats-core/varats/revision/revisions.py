@@ -76,11 +76,11 @@ def __get_result_files_dict(
         return result_files
 
     for res_file in res_dir.iterdir():
-        if result_file_type.is_result_file(
-            res_file.name
-        ) and result_file_type.is_correct_report_type(res_file.name):
+        file_name = res_file.name
+        # is_correct_report_type only accepts well-formed result files
+        if result_file_type.is_correct_report_type(file_name):
             commit_hash = result_file_type.get_commit_hash_from_result_file(
-                res_file.name
+                file_name
             )
             result_files[commit_hash].append(res_file)
 
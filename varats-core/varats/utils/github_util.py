@@ -1,20 +1,20 @@
 """Utility module for working with the pygithub API."""
 import codecs
 import logging
+import math
 import pickle  # nosec
+import threading
 import typing as tp
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
 from github import Github
 from github.GithubObject import GithubObject
+from github.PaginatedList import PaginatedList
 
 from varats.utils.settings import vara_cfg
 
-if tp.TYPE_CHECKING:
-    # pylint: disable=unused-import,ungrouped-imports
-    from github.PaginatedList import PaginatedList
-
 LOG = logging.getLogger(__name__)
 
 
@@ -35,6 +35,7 @@ __PYGITHUB_CACHE_FILE_NAME = "pygithub.csv.gz"
 __PYGITHUB_KEY_COLUMN = "key"
 __PYGITHUB_LIST_LENGTH_COLUMN = "length"
 __PYGITHUB_OBJECT_COLUMN = "object"
+__PYGITHUB_MAX_PAGE_WORKERS = 5
 
 PyGithubObj = tp.TypeVar("PyGithubObj", bound=GithubObject)
 
@@ -54,19 +55,25 @@ def _dump_pygithub_object(obj: GithubObject) -> str:
     ).decode()
 
 
-def _load_pygithub_object(obj: str) -> GithubObject:
+def _load_pygithub_object(
+    obj: str, github: tp.Optional[Github] = None
+) -> GithubObject:
     """
     Unpickle a GithubObject.
 
     Args:
         obj: the object to unpickle
+        github: the Github instance used to recreate the object; a new one is
+                created if none is given
 
     Returns:
         the unpickled object
     """
+    if github is None:
+        github = get_github_instance()
     return tp.cast(
         GithubObject,
-        get_github_instance().create_from_raw_data(
+        github.create_from_raw_data(
             *pickle.loads(codecs.decode(obj.encode(), "base64"))  # nosec
         )
     )
@@ -138,18 +145,15 @@ def _cache_pygithub_object_list(key: str, objs: tp.List[PyGithubObj]) -> None:
         key: the unique identifier for the list to store
     """
     cache_df = _load_cache_file()
-    cache_df = cache_df.append({
+    list_df = pd.DataFrame([{
         __PYGITHUB_KEY_COLUMN: key,
         __PYGITHUB_LIST_LENGTH_COLUMN: len(objs)
-    },
-                               ignore_index=True)
-    for idx, obj in enumerate(objs):
-        cache_df = cache_df.append({
-            __PYGITHUB_KEY_COLUMN: f"{key}_{idx}",
-            __PYGITHUB_OBJECT_COLUMN: _dump_pygithub_object(obj)
-        },
-                                   ignore_index=True)
-        _store_cache_file(cache_df)
+    }] + [{
+        __PYGITHUB_KEY_COLUMN: f"{key}_{idx}",
+        __PYGITHUB_OBJECT_COLUMN: _dump_pygithub_object(obj)
+    } for idx, obj in enumerate(objs)])
+    cache_df = pd.concat([cache_df, list_df], ignore_index=True, sort=False)
+    _store_cache_file(cache_df)
 
 
 def _get_cached_pygithub_object_list(
@@ -169,20 +173,64 @@ def _get_cached_pygithub_object_list(
     if list_header.empty:
         return None
     list_length: int = int(list_header[__PYGITHUB_LIST_LENGTH_COLUMN].item())
-    selected_rows = pd.DataFrame()
-    for idx in range(list_length):
-        selected_rows = selected_rows.append(
-            cache_df[cache_df[__PYGITHUB_KEY_COLUMN] == f"{key}_{idx}"],
-            ignore_index=True
+    # select all list entries at once instead of filtering once per entry
+    entry_keys = [f"{key}_{idx}" for idx in range(list_length)]
+    selected_rows = cache_df[cache_df[__PYGITHUB_KEY_COLUMN].isin(entry_keys)]
+    cached_objects: tp.Dict[str, str] = dict(
+        zip(
+            selected_rows[__PYGITHUB_KEY_COLUMN],
+            selected_rows[__PYGITHUB_OBJECT_COLUMN]
         )
-    if len(selected_rows) != list_length:
+    )
+    if len(cached_objects) != list_length:
         raise AssertionError("List length is not equal to list header.")
+    github = get_github_instance()
     return [
-        _load_pygithub_object(obj)
-        for obj in selected_rows[__PYGITHUB_OBJECT_COLUMN].tolist()
+        _load_pygithub_object(cached_objects[entry_key], github)
+        for entry_key in entry_keys
     ]
 
 
+def _fetch_all_pages(
+    load_function: 'tp.Callable[[Github], PaginatedList[PyGithubObj]]'
+) -> tp.List[PyGithubObj]:
+    """
+    Fetch all elements of a PaginatedList, requesting the pages concurrently.
+
+    PyGithub's requester is not thread-safe, so every worker thread loads the
+    list with its own Github instance.
+
+    Args:
+        load_function: function that loads a PaginatedList of PygithubObjs
+
+    Returns:
+        the elements of all pages in order
+    """
+    github = get_github_instance()
+    paginated_list = load_function(github)
+    if not isinstance(paginated_list, PaginatedList):
+        return list(paginated_list)
+
+    num_pages = math.ceil(paginated_list.totalCount / github.per_page)
+    if num_pages <= 1:
+        return list(paginated_list)
+
+    worker_state = threading.local()
+
+    def get_page(page: int) -> tp.List[PyGithubObj]:
+        if not hasattr(worker_state, "paginated_list"):
+            worker_state.paginated_list = load_function(get_github_instance())
+        return tp.cast(
+            tp.List[PyGithubObj], worker_state.paginated_list.get_page(page)
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=__PYGITHUB_MAX_PAGE_WORKERS
+    ) as executor:
+        pages = executor.map(get_page, range(num_pages))
+        return [obj for page in pages for obj in page]
+
+
 def get_cached_github_object(
     cached_object_key: str, load_function: tp.Callable[[Github], PyGithubObj]
 ) -> PyGithubObj:
@@ -224,6 +272,6 @@ def get_cached_github_object_list(
     if cached_list:
         return [tp.cast(PyGithubObj, obj) for obj in cached_list]
 
-    obj_list_to_cache = list(load_function(get_github_instance()))
+    obj_list_to_cache = _fetch_all_pages(load_function)
     _cache_pygithub_object_list(cached_object_key, obj_list_to_cache)
     return obj_list_to_cache
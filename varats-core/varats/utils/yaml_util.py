@@ -5,6 +5,24 @@ import typing as tp
 from pathlib import Path
 
 import yaml
+from yaml.events import (
+    AliasEvent,
+    DocumentEndEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+
+try:
+    from yaml.cyaml import CParser as _YamlParser
+except ImportError:
+    # PyYAML was built without libyaml, use the pure python parser
+    from yaml import BaseLoader as _YamlParser  # type: ignore
+
+# plain scalars that yaml resolves to null
+_NULL_SCALARS = frozenset(('', '~', 'null', 'Null', 'NULL'))
 
 
 def store_as_yaml(file_path: Path, objects: tp.Iterable[tp.Any]) -> None:
@@ -42,3 +60,67 @@ def load_yaml(file_path: Path) -> tp.Iterator[tp.Any]:
     raise FileNotFoundError(
         errno.ENOENT, os.strerror(errno.ENOENT), str(file_path)
     )
+
+
+def load_plain_yaml_documents(stream: tp.Any) -> tp.Iterator[tp.Any]:
+    """
+    Lazily load all documents of a yaml stream as plain python data.
+
+    The documents are built directly from parser events, which skips composing
+    a node graph and resolving tags. Mappings become dicts, sequences become
+    lists, untagged plain null scalars become ``None``, and all other scalars
+    are kept as strings, like with ``yaml.BaseLoader``. This is considerably
+    faster for large, machine generated files, e.g., reports.
+
+    Args:
+        stream: a string or a readable stream with the yaml documents
+
+    Returns: an iterator over the loaded documents
+    """
+    parser = _YamlParser(stream)
+    # open containers and, for mappings, the key waiting for its value
+    containers: tp.List[tp.Any] = []
+    pending_keys: tp.List[tp.Any] = []
+    no_key = object()
+    document: tp.Any = None
+
+    while parser.check_event():
+        event = parser.get_event()
+        event_type = type(event)
+
+        if event_type is ScalarEvent:
+            value = event.value
+            # implicit[0] is only set for untagged plain scalars
+            if event.implicit[0] and value in _NULL_SCALARS:
+                value = None
+        elif event_type is MappingStartEvent:
+            containers.append({})
+            pending_keys.append(no_key)
+            continue
+        elif event_type is SequenceStartEvent:
+            containers.append([])
+            pending_keys.append(no_key)
+            continue
+        elif event_type is MappingEndEvent or event_type is SequenceEndEvent:
+            value = containers.pop()
+            pending_keys.pop()
+        elif event_type is DocumentEndEvent:
+            yield document
+            document = None
+            continue
+        elif event_type is AliasEvent:
+            raise yaml.YAMLError(
+                f"Aliases are not supported: {event.start_mark}"
+            )
+        else:
+            continue
+
+        if not containers:
+            document = value
+        elif isinstance(containers[-1], list):
+            containers[-1].append(value)
+        elif pending_keys[-1] is no_key:
+            pending_keys[-1] = value
+        else:
+            containers[-1][pending_keys[-1]] = value
+            pending_keys[-1] = no_key
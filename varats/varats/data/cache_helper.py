@@ -1,6 +1,9 @@
 """Utility functions and class to allow easier caching of pandas dataframes and
 other data."""
 import logging
+import os
+import pickle  # nosec
+import tempfile
 import typing as tp
 from pathlib import Path
 
@@ -72,6 +75,70 @@ def cache_dataframe(
     dataframe.to_csv(str(file_path), compression='infer')
 
 
+def get_object_cache_file_path(data_id: str) -> Path:
+    """
+    Compose the identifier into a file path that points to the corresponding
+    pickled object in the cache directory.
+
+    Args:
+        data_id: identifier of the cached object
+
+    Test:
+    >>> str(get_object_cache_file_path("foo"))
+    'data_cache/foo.pickle'
+    """
+    return Path(str(vara_cfg()["data_cache"])) / f"{data_id}.pickle"
+
+
+def load_cached_object_or_none(data_id: str) -> tp.Optional[tp.Any]:
+    """
+    Load a pickled object from the cache directory, otherwise return None.
+
+    Cache files that cannot be unpickled, e.g., because they are truncated or
+    refer to classes that were moved or changed since they were written, are
+    treated as missing.
+
+    Args:
+        data_id: identifier of the cached object
+    """
+    file_path = get_object_cache_file_path(data_id)
+    if not file_path.exists():
+        return None
+
+    try:
+        with open(file_path, "rb") as cache_file:
+            return pickle.load(cache_file)  # nosec
+    except (
+        OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+        TypeError, ValueError
+    ) as error:
+        LOG.warning(f"Could not load cached object {file_path}: {error}")
+        return None
+
+
+def cache_object(data_id: str, obj: tp.Any) -> None:
+    """
+    Cache an object by pickling it to disk.
+
+    The object is written to a temporary file first and then moved into place,
+    so concurrent readers never see a partially written cache file.
+
+    Args:
+        data_id: identifier of the cached object
+        obj: the object to store
+    """
+    file_path = get_object_cache_file_path(data_id)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_name = tempfile.mkstemp(dir=file_path.parent)
+    try:
+        with os.fdopen(tmp_fd, "wb") as tmp_file:
+            pickle.dump(obj, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
 InDataType = tp.TypeVar("InDataType")
 
 
@@ -86,6 +153,11 @@ def __create_cache_entry(
     return new_df
 
 
+def __should_log_progress(num: int, total: int) -> bool:
+    """Limit progress messages to roughly one per percent of the entries."""
+    return (num + 1) % max(1, total // 100) == 0 or num + 1 == total
+
+
 def build_cached_report_table(
     data_id: str, project_name: str, data_to_load: tp.List[InDataType],
     data_to_drop: tp.List[InDataType],
@@ -122,18 +194,23 @@ def build_cached_report_table(
     else:
         cached_df = optional_cached_df
 
+    # index the cached entries once instead of scanning the whole cache column
+    # for every data item; the first entry of an id takes precedence
+    cached_timestamps: tp.Dict[str, str] = {}
+    for entry_id, entry_timestamp in zip(
+        cached_df[CACHE_ID_COL], cached_df[CACHE_TIMESTAMP_COL]
+    ):
+        cached_timestamps.setdefault(entry_id, entry_timestamp)
+
     def is_missing_file(report_file: InDataType) -> bool:
-        return not tp.cast(
-            bool, (cached_df[CACHE_ID_COL] == get_entry_id(report_file)).any()
-        )
+        return get_entry_id(report_file) not in cached_timestamps
 
     def is_newer_file(report_file: InDataType) -> bool:
-        cached_entry = cached_df[cached_df[CACHE_ID_COL] ==
-                                 get_entry_id(report_file)][CACHE_TIMESTAMP_COL]
+        cached_timestamp = cached_timestamps.get(get_entry_id(report_file))
 
-        if len(cached_entry) > 0:
+        if cached_timestamp is not None:
             return is_newer_timestamp(
-                get_entry_timestamp(report_file), cached_entry.iloc[0]
+                get_entry_timestamp(report_file), cached_timestamp
             )
         # We found no existing entry, so it will never be considered for
         # updating and does not need to be deleted.
@@ -151,10 +228,11 @@ def build_cached_report_table(
 
     new_data_frames = []
     for num, data_entry in enumerate(missing_entries):
-        LOG.info(
-            f"Creating missing entry ({(num + 1)}/"
-            f"{len(missing_entries)}): {data_entry}"
-        )
+        if __should_log_progress(num, len(missing_entries)):
+            LOG.info(
+                f"Creating missing entry ({(num + 1)}/"
+                f"{len(missing_entries)}): {data_entry}"
+            )
         new_data_frames.append(
             __create_cache_entry(create_cache_entry_data, data_entry)
         )
@@ -163,18 +241,26 @@ def build_cached_report_table(
                        ignore_index=True,
                        sort=False)
 
-    new_df.set_index(CACHE_ID_COL, inplace=True)
+    updated_data_frames = []
     for num, data_entry in enumerate(updated_entries):
-        LOG.info(
-            f"Updating outdated entry "
-            f"({(num + 1)}/{len(updated_entries)}): {data_entry}"
-        )
-        updated_entry = __create_cache_entry(
-            create_cache_entry_data, data_entry
+        if __should_log_progress(num, len(updated_entries)):
+            LOG.info(
+                f"Updating outdated entry "
+                f"({(num + 1)}/{len(updated_entries)}): {data_entry}"
+            )
+        updated_data_frames.append(
+            __create_cache_entry(create_cache_entry_data, data_entry)
         )
-        updated_entry.set_index(CACHE_ID_COL, inplace=True)
-        new_df.update(updated_entry)
-    new_df.reset_index(inplace=True)
+
+    if updated_data_frames:
+        # apply all updates at once instead of updating the table per entry
+        updated_df = pd.concat(
+            updated_data_frames, ignore_index=True, sort=False
+        ).set_index(CACHE_ID_COL)
+        updated_df = updated_df[~updated_df.index.duplicated(keep='last')]
+        new_df.set_index(CACHE_ID_COL, inplace=True)
+        new_df.update(updated_df)
+        new_df.reset_index(inplace=True)
 
     if len(failed_entries) > 0:
         LOG.info(f"Dropping {len(failed_entries)} entries")
@@ -183,7 +269,9 @@ def build_cached_report_table(
             inplace=True
         )
 
-    cache_dataframe(data_id, project_name, new_df)
+    # only rewrite the (compressed) cache file if its content changed
+    if missing_entries or updated_entries or failed_entries:
+        cache_dataframe(data_id, project_name, new_df)
 
     return new_df.loc[:, [
         col for col in new_df.columns
@@ -16,6 +16,7 @@ from threading import Lock
 
 from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 
+from varats.data.cache_helper import cache_object, load_cached_object_or_none
 from varats.report.report import BaseReport
 
 LoadableType = tp.TypeVar('LoadableType', bound=BaseReport)
@@ -75,7 +76,6 @@ class FileBlob():
 class FileSignal(QObject):
     """Emit signals after the file was loaded."""
     finished = pyqtSignal(object)
-    clean = pyqtSignal()
 
 
 class FileLoader(QRunnable):
@@ -96,7 +96,6 @@ class FileLoader(QRunnable):
         """Run the file loading method."""
         loaded_data_class = self.func(self.file_path, self.class_type)
         self.signal.finished.emit(loaded_data_class)
-        self.signal.clean.emit()
 
 
 class DataManager():
@@ -112,25 +111,75 @@ class DataManager():
         self.thread_pool = QThreadPool()
         self.loader_lock = Lock()
 
+    @staticmethod
+    def __create_data_class(
+        key: str, file_path: Path, DataClassTy: tp.Type[LoadableType],
+        persist: bool
+    ) -> LoadableType:
+        # pylint: disable=invalid-name
+        """Create a DataClass of type <DataClassTy>, reusing a pickled instance
+        from the data cache if <persist> is set.
+
+        A pickled instance is only reused if it was created by the current
+        CACHE_VERSION of <DataClassTy> from the same file contents, size, and
+        modification time. Otherwise, the file is parsed again and the pickle
+        is replaced, so there is at most one cache file per report file.
+
+        Cache files are keyed by the absolute report path and are never
+        evicted, i.e., the pickles of deleted or moved report files stay in
+        the data cache until the data cache directory is cleaned up manually.
+        """
+        if not persist:
+            return DataClassTy(file_path)
+
+        file_stat = file_path.stat()
+        cache_tag = (
+            DataClassTy.CACHE_VERSION, key, file_stat.st_size,
+            file_stat.st_mtime_ns
+        )
+        data_id = DataClassTy.__name__ + "-" + hashlib.sha256(
+            bytes(str(file_path.absolute()), 'utf-8')
+        ).hexdigest()
+
+        cached_entry = load_cached_object_or_none(data_id)
+        if isinstance(cached_entry, tuple) and len(cached_entry) == 2:
+            cached_tag, cached_data_class = cached_entry
+            if cached_tag == cache_tag and isinstance(
+                cached_data_class, DataClassTy
+            ) and cached_data_class.path == file_path:
+                return cached_data_class
+
+        data_class = DataClassTy(file_path)
+        cache_object(data_id, (cache_tag, data_class))
+        return data_class
+
     def __load_data_class(
-        self, file_path: Path, DataClassTy: tp.Type[LoadableType]
+        self,
+        file_path: Path,
+        DataClassTy: tp.Type[LoadableType],
+        persist: bool = False
     ) -> LoadableType:
         # pylint: disable=invalid-name
-        """Load a DataClass of type <DataClassTy> from a file."""
-        self.loader_lock.acquire()
+        """
+        Load a DataClass of type <DataClassTy> from a file.
 
+        Only the lookup and insertion into the file map are guarded by the lock,
+        so independent files are checksummed and parsed concurrently.
+        """
         key = sha256_checksum(file_path)
-        if key in self.file_map:
-            return tp.cast(LoadableType, self.file_map[key].data)
+        with self.loader_lock:
+            if key in self.file_map:
+                return tp.cast(LoadableType, self.file_map[key].data)
 
-        try:
-            new_blob = FileBlob(key, file_path, DataClassTy(file_path))
-        except Exception as e:
-            self.loader_lock.release()
-            raise e
-        self.file_map[key] = new_blob
+        new_blob = FileBlob(
+            key, file_path,
+            self.__create_data_class(key, file_path, DataClassTy, persist)
+        )
+        with self.loader_lock:
+            # another thread could have loaded the same file in the meantime
+            blob = self.file_map.setdefault(key, new_blob)
 
-        return tp.cast(LoadableType, new_blob.data)
+        return tp.cast(LoadableType, blob.data)
 
     def load_data_class(
         self, file_path: Path, DataClassTy: tp.Type[LoadableType],
@@ -150,11 +199,13 @@ class DataManager():
 
         worker = FileLoader(self.__load_data_class, file_path, DataClassTy)
         worker.signal.finished.connect(loaded_callback)
-        worker.signal.clean.connect(self._release_lock)
         self.thread_pool.start(worker)
 
     def load_data_class_sync(
-        self, file_path: Path, DataClassTy: tp.Type[LoadableType]
+        self,
+        file_path: Path,
+        DataClassTy: tp.Type[LoadableType],
+        persist: bool = False
     ) -> LoadableType:
         # pylint: disable=invalid-name
         """
@@ -163,6 +214,8 @@ class DataManager():
         Args:
             file_path: to the file
             DataClassTy: type of the report class to be loaded
+            persist: whether the parsed DataClass should be pickled to the
+                     data cache, so later sessions can skip parsing the file
 
         Returns:
             the loaded report file
@@ -170,12 +223,7 @@ class DataManager():
         if not os.path.isfile(file_path):
             raise FileNotFoundError
 
-        loaded_file = self.__load_data_class(file_path, DataClassTy)
-        self._release_lock()
-        return loaded_file
-
-    def _release_lock(self) -> None:
-        self.loader_lock.release()
+        return self.__load_data_class(file_path, DataClassTy, persist)
 
 
 VDM = DataManager()
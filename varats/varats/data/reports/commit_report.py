@@ -4,11 +4,11 @@ import typing as tp
 from pathlib import Path
 
 import pandas as pd
-import yaml
 
 from varats.base.version_header import VersionHeader
 from varats.mapping.commit_map import CommitMap
 from varats.report.report import BaseReport, FileStatusExtension, MetaReport
+from varats.utils.yaml_util import load_plain_yaml_documents
 
 LOG = logging.getLogger(__name__)
 
@@ -140,11 +140,12 @@ class CommitReport(BaseReport):
 
     SHORTHAND = "CR"
     FILE_TYPE = "yaml"
+    CACHE_VERSION = 2
 
     def __init__(self, path: Path) -> None:
         super().__init__(path)
         with open(path, "r") as stream:
-            documents = yaml.load_all(stream, Loader=yaml.CLoader)
+            documents = load_plain_yaml_documents(stream)
             version_header = VersionHeader(next(documents))
             version_header.raise_if_not_type("CommitReport")
             version_header.raise_if_version_is_less_than(3)
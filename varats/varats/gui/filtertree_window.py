@@ -709,7 +709,12 @@ class FilterWindow(QMainWindow, Ui_FilterEditor):
         try:
             with open(filename[0], 'r') as yaml_file:
                 documents = yaml_file.read().split("---")
-                version_header = VersionHeader(yaml.load(documents[0]))
+                version_header = VersionHeader(
+                    yaml.load(
+                        documents[0],
+                        Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                    )
+                )
                 version_header.raise_if_not_type("InteractionFilter")
                 version_header.raise_if_version_is_less_than(1)
 
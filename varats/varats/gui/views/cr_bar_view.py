@@ -1,5 +1,6 @@
 """Module to manage the CommitReport BarView."""
 
+import bisect
 from os import path
 
 from PyQt5.QtCore import Qt, QTimer
@@ -22,6 +23,10 @@ class CRBarView(QWidget, Ui_Form):
         super().__init__()
 
         self.commit_reports = []
+        self.__loaded_reports = set()
+        self.__order_func = None
+        self.__order_keys = []
+        self.__loaded_paths = set()
         self.commit_report_merged_meta = CommitReportMeta()
         self.__current_report = None
         self.c_map = None
@@ -74,32 +79,28 @@ class CRBarView(QWidget, Ui_Form):
         )
 
         for file_path in file_paths:
-            if not path.isfile(file_path):
+            if not file_path.endswith((".yaml", ".yml")):
                 err = QMessageBox()
                 err.setIcon(QMessageBox.Warning)
-                err.setWindowTitle("File not found.")
-                err.setText("Could not find selected file.")
+                err.setWindowTitle("Wrong File ending.")
+                err.setText("File seems not to be a yaml file.")
                 err.setStandardButtons(QMessageBox.Ok)
                 err.exec_()
                 return
 
-            if not (file_path.endswith(".yaml") or file_path.endswith(".yml")):
+            if not path.isfile(file_path):
                 err = QMessageBox()
                 err.setIcon(QMessageBox.Warning)
-                err.setWindowTitle("Wrong File ending.")
-                err.setText("File seems not to be a yaml file.")
+                err.setWindowTitle("File not found.")
+                err.setText("Could not find selected file.")
                 err.setStandardButtons(QMessageBox.Ok)
                 err.exec_()
                 return
 
         for file_path in file_paths:
-            skip = False
-            for current_report in self.commit_reports:
-                # skip files that were loaded bevor
-                if current_report.path == file_path:
-                    skip = True
-                    continue
-            if skip:
+            # skip files that were loaded before, paths are only recorded
+            # after a successful load so that failed files can be retried
+            if file_path in self.__loaded_paths:
                 continue
             self.loading_files += 1
             self.statusLabel.setText(
@@ -136,8 +137,10 @@ class CRBarView(QWidget, Ui_Form):
     def _set_new_commit_report(self, commit_report):
         self.loading_files -= 1
 
-        if commit_report not in self.commit_reports:
-            self.commit_reports.append(commit_report)
+        if commit_report not in self.__loaded_reports:
+            self.__loaded_reports.add(commit_report)
+            self.__loaded_paths.add(str(commit_report.path))
+            self._insert_commit_report(commit_report)
             self.commit_report_merged_meta.merge(commit_report)
             self._adjust_slider()
 
@@ -148,7 +151,18 @@ class CRBarView(QWidget, Ui_Form):
                 "Loading files... " + str(self.loading_files)
             )
 
-        self._update_report_order()
+    def _insert_commit_report(self, commit_report):
+        """Insert a report at its position in the current report order, so the
+        reports do not need to be sorted again for every loaded file."""
+        key = self.__order_func(commit_report)
+        idx = bisect.bisect_right(self.__order_keys, key)
+        self.__order_keys.insert(idx, key)
+        self.commit_reports.insert(idx, commit_report)
+
+        self.fileSlider.setMaximum(max(len(self.commit_reports) - 1, 0))
+        if self.current_report is not None:
+            idx = self.commit_reports.index(self.current_report)
+            self.fileSlider.setSliderPosition(idx)
 
     def _draw_plots(self) -> None:
         if self.current_report is None:
@@ -205,7 +219,9 @@ class CRBarView(QWidget, Ui_Form):
             def order_func(x):
                 return x
 
+        self.__order_func = order_func
         self.commit_reports.sort(key=order_func)
+        self.__order_keys = [order_func(x) for x in self.commit_reports]
         if self.current_report is not None:
             idx = self.commit_reports.index(self.current_report)
             self.fileSlider.setSliderPosition(idx)
@@ -17,10 +17,13 @@ def load_commit_report(file_path: Path) -> CommitReport:
     """
     Load a CommitReport from a file.
 
+    Parsed reports are pickled to the data cache, so loading the same file
+    again in a later session does not need to parse the YAML.
+
     Attributes:
         file_path (Path): Full path to the file
     """
-    return VDM.load_data_class_sync(file_path, CommitReport)
+    return VDM.load_data_class_sync(file_path, CommitReport, persist=True)
 
 
 def load_blame_report(file_path: Path) -> BlameReport:
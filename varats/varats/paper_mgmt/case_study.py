@@ -421,12 +421,12 @@ def extend_with_revs_per_year(
     last_commit = repo[repo.head.target]
     revs_year_sep = kwargs['revs_year_sep']
 
-    commits: tp.DefaultDict[int, tp.List[str]] = defaultdict(
-        list
-    )  # maps year -> list of commits
+    # maps year -> list of commit ids, which are only converted to hashes
+    # for the sampled commits
+    commits: tp.DefaultDict[int, tp.List[pygit2.Oid]] = defaultdict(list)
     for commit in repo.walk(last_commit.id, pygit2.GIT_SORT_TIME):
         commit_date = datetime.utcfromtimestamp(commit.commit_time)
-        commits[commit_date.year].append(str(commit.id))
+        commits[commit_date.year].append(commit.id)
 
     new_rev_items = []  # new revisions that get added to to case_study
     project_cls = get_project_cls_by_name(case_study.project_name)
@@ -437,7 +437,7 @@ def extend_with_revs_per_year(
         )
 
         for commit_index in sample_commit_indices:
-            commit_hash = commits_in_year[commit_index]
+            commit_hash = str(commits_in_year[commit_index])
             if kwargs["ignore_blocked"] and is_revision_blocked(
                 commit_hash, project_cls
             ):
@@ -12,6 +12,7 @@ from matplotlib import cm
 from varats.data.databases.commit_interaction_database import (
     CommitInteractionDatabase,
 )
+from varats.mapping.commit_map import CommitMap
 from varats.paper.case_study import CaseStudy, CSStage
 from varats.plot.plot import Plot, PlotDataEmpty
 from varats.plot.plot_utils import check_required_args
@@ -56,11 +57,13 @@ def _plot_interaction_graph(
 
     data_frame.sort_values(by=['time_id'], inplace=True)
 
+    revisions = data_frame['revision'].values
+
     # Interaction plot
-    axis = plt.subplot(211)  # 211
+    top_axis = plt.subplot(211)
 
-    plt.setp(axis.get_yticklabels(), fontsize=8, fontfamily='monospace')
-    plt.setp(axis.get_xticklabels(), visible=False)
+    plt.setp(top_axis.get_yticklabels(), fontsize=8, fontfamily='monospace')
+    plt.setp(top_axis.get_xticklabels(), visible=False)
 
     if stages:
         # We need to plot all different stages separatly
@@ -75,100 +78,93 @@ def _plot_interaction_graph(
         for stage in reversed(stages):
             stage_num -= 1
 
-            cf_mask = np.isfinite(data_frame.CFInteractions.values)
-            plt.plot(
-                data_frame.revisions.values[cf_mask],
-                data_frame.CFInteractions.values[cf_mask],
+            cf_interactions = data_frame['CFInteractions'].values
+            cf_mask = np.isfinite(cf_interactions)
+            top_axis.plot(
+                revisions[cf_mask],
+                cf_interactions[cf_mask],
                 color=next(cf_color_iter),
                 label="CFInteractions-" + str(stage_num),
                 zorder=stage_num + 1,
                 linewidth=plot_cfg['linewidth']
             )
 
-            df_mask = np.isfinite(data_frame.DFInteractions.values)
-            plt.plot(
-                data_frame.revision.values[df_mask],
-                data_frame.DFInteractions.values[df_mask],
+            df_interactions = data_frame['DFInteractions'].values
+            df_mask = np.isfinite(df_interactions)
+            top_axis.plot(
+                revisions[df_mask],
+                df_interactions[df_mask],
                 color=next(df_color_iter),
                 label="DFInteractions-" + str(stage_num),
                 zorder=stage_num + 1,
                 linewidth=plot_cfg['linewidth']
             )
 
-            def filter_out_stage(data_frame: pd.DataFrame) -> None:
-
-                def cf_removal_helper(
-                    row: pd.Series,
-                    stage: CSStage = stage
-                ) -> tp.Union[np.int64]:
-                    if stage.has_revision(row.revision):
-                        return np.NaN
-                    return row['CFInteractions']
-
-                data_frame['CFInteractions'] = data_frame.apply(
-                    cf_removal_helper, axis=1
-                )
-
-                def df_removal_helper(
-                    row: pd.Series,
-                    stage: CSStage = stage
-                ) -> tp.Union[np.int64]:
-                    if stage.has_revision(row.revision):
-                        return np.NaN
-                    return row['DFInteractions']
-
-                data_frame['DFInteractions'] = data_frame.apply(
-                    func=df_removal_helper, axis=1
-                )
+            def filter_out_stage(
+                data_frame: pd.DataFrame, stage: CSStage
+            ) -> None:
+                in_stage = data_frame['revision'].map(stage.has_revision)
+                data_frame.loc[in_stage,
+                               ['CFInteractions', 'DFInteractions']] = np.NaN
 
-            filter_out_stage(data_frame)
+            filter_out_stage(data_frame, stage)
 
     else:
-        plt.plot(
-            'revision',
-            'CFInteractions',
-            data=data_frame,
+        top_axis.plot(
+            revisions,
+            data_frame['CFInteractions'].values,
+            label='CFInteractions',
             color='blue',
             linewidth=plot_cfg['linewidth']
         )
-        plt.plot(
-            'revision',
-            'DFInteractions',
-            data=data_frame,
+        top_axis.plot(
+            revisions,
+            data_frame['DFInteractions'].values,
+            label='DFInteractions',
             color='red',
             linewidth=plot_cfg['linewidth']
         )
 
-    axis.legend(prop={'size': plot_cfg['legend_size'], 'family': 'monospace'})
+    top_axis.legend(
+        prop={
+            'size': plot_cfg['legend_size'],
+            'family': 'monospace'
+        }
+    )
 
     # Head interaction plot
-    axis = plt.subplot(212)
+    bottom_axis = plt.subplot(212)
 
-    plt.setp(axis.get_yticklabels(), fontsize=8, fontfamily='monospace')
+    plt.setp(bottom_axis.get_yticklabels(), fontsize=8, fontfamily='monospace')
     plt.setp(
-        axis.get_xticklabels(),
+        bottom_axis.get_xticklabels(),
         fontsize=plot_cfg['xtick_size'],
         fontfamily='monospace',
         rotation=270
     )
 
-    plt.plot(
-        'revision',
-        'HEAD CF Interactions',
-        data=data_frame,
+    bottom_axis.plot(
+        revisions,
+        data_frame['HEAD CF Interactions'].values,
+        label='HEAD CF Interactions',
         color='aqua',
         linewidth=plot_cfg['linewidth']
     )
-    plt.plot(
-        'revision',
-        'HEAD DF Interactions',
-        data=data_frame,
+    bottom_axis.plot(
+        revisions,
+        data_frame['HEAD DF Interactions'].values,
+        label='HEAD DF Interactions',
         color='crimson',
         linewidth=plot_cfg['linewidth']
     )
 
-    plt.xlabel("Revisions", **{'size': '10'})
-    axis.legend(prop={'size': plot_cfg['legend_size'], 'family': 'monospace'})
+    bottom_axis.set_xlabel("Revisions", size='10')
+    bottom_axis.legend(
+        prop={
+            'size': plot_cfg['legend_size'],
+            'family': 'monospace'
+        }
+    )
 
 
 class InteractionPlot(Plot):
@@ -197,9 +193,8 @@ class InteractionPlot(Plot):
             if self.plot_kwargs['plot_case_study'] is None:
                 return data_frame
             case_study: CaseStudy = self.plot_kwargs['plot_case_study']
-            return data_frame[data_frame.apply(
-                lambda x: case_study.has_revision(x['head_cm'].split('-')[1]),
-                axis=1
+            return data_frame[data_frame['revision'].map(
+                case_study.has_revision
             )]
 
         interaction_plot_df = _gen_interaction_graph(**self.plot_kwargs)
@@ -215,55 +210,54 @@ class InteractionPlot(Plot):
         )
 
     def calc_missing_revisions(self, boundary_gradient: float) -> tp.Set[str]:
+        commit_map: CommitMap = self.plot_kwargs['get_cmap']()
         data_frame = _gen_interaction_graph(**self.plot_kwargs)
-        data_frame.sort_values(by=['head_cm'], inplace=True)
+        data_frame.sort_values(by=['time_id'], inplace=True)
         data_frame.reset_index(drop=True, inplace=True)
 
-        def cm_num(head_cm: str) -> int:
-            return int(head_cm.split('-')[0])
-
-        def head_cm_neighbours(lhs_cm: str, rhs_cm: str) -> bool:
-            return cm_num(lhs_cm) + 1 == cm_num(rhs_cm)
-
-        def rev_calc_helper(data_frame: pd.DataFrame) -> tp.Set[str]:
+        def rev_calc_helper(interaction_column: str) -> tp.Set[str]:
             new_revs: tp.Set[str] = set()
 
             df_iter = data_frame.iterrows()
             _, last_row = next(df_iter)
             for _, row in df_iter:
-                gradient = abs(1 - (last_row[1] / float(row[1])))
+                gradient = abs(
+                    1 - (
+                        last_row[interaction_column] /
+                        float(row[interaction_column])
+                    )
+                )
                 if gradient > boundary_gradient:
-                    lhs_cm = last_row['head_cm']
-                    rhs_cm = row['head_cm']
+                    lhs_rev = last_row['revision']
+                    rhs_rev = row['revision']
 
-                    if head_cm_neighbours(lhs_cm, rhs_cm):
+                    if last_row['time_id'] + 1 == row['time_id']:
                         print(
                             "Found steep gradient between neighbours " +
-                            "{lhs_cm} - {rhs_cm}: {gradient}".format(
-                                lhs_cm=lhs_cm,
-                                rhs_cm=rhs_cm,
+                            "{lhs_rev} - {rhs_rev}: {gradient}".format(
+                                lhs_rev=lhs_rev,
+                                rhs_rev=rhs_rev,
                                 gradient=round(gradient, 5)
                             )
                         )
                         git_path = Path(self.plot_kwargs['git_path'])
-                        lhs = lhs_cm.split('-')[1]
-                        rhs = rhs_cm.split('-')[1]
                         print(
-                            f"Investigate: git -C {git_path} diff {lhs} {rhs}"
+                            f"Investigate: git -C {git_path} diff "
+                            f"{lhs_rev} {rhs_rev}"
                         )
                     else:
                         print(
                             "Unusual gradient between " +
-                            "{lhs_cm} - {rhs_cm}: {gradient}".format(
-                                lhs_cm=lhs_cm,
-                                rhs_cm=rhs_cm,
+                            "{lhs_rev} - {rhs_rev}: {gradient}".format(
+                                lhs_rev=lhs_rev,
+                                rhs_rev=rhs_rev,
                                 gradient=round(gradient, 5)
                             )
                         )
                         new_rev_id = round(
-                            (cm_num(lhs_cm) + cm_num(rhs_cm)) / 2.0
+                            (last_row['time_id'] + row['time_id']) / 2.0
                         )
-                        new_rev = self.plot_kwargs['cmap'].c_hash(new_rev_id)
+                        new_rev = commit_map.c_hash(new_rev_id)
                         print(
                             "-> Adding {rev} as new revision to the sample set".
                             format(rev=new_rev)
@@ -274,13 +268,9 @@ class InteractionPlot(Plot):
             return new_revs
 
         print("--- Checking CFInteractions ---")
-        missing_revs = rev_calc_helper(
-            data_frame[['head_cm', 'CFInteractions']]
-        )
+        missing_revs = rev_calc_helper('CFInteractions')
 
         print("--- Checking DFInteractions ---")
-        missing_revs.union(
-            rev_calc_helper(data_frame[['head_cm', 'DFInteractions']])
-        )
+        missing_revs |= rev_calc_helper('DFInteractions')
 
         return missing_revs
@@ -15,6 +15,10 @@ from varats.project.project_util import (
 from varats.provider.cve.cve_provider import CVEProviderHook
 from varats.utils.settings import bb_cfg
 
+_CURL_BINARIES = wrap_paths_to_binaries([
+    ('src/.libs/curl', BinaryType.executable)
+])
+
 
 class Curl(bb.Project, CVEProviderHook):  # type: ignore
     """
@@ -41,9 +45,7 @@ class Curl(bb.Project, CVEProviderHook):  # type: ignore
     @property
     def binaries(self) -> tp.List[ProjectBinaryWrapper]:
         """Return a list of binaries generated by the project."""
-        return wrap_paths_to_binaries([
-            ('src/.libs/curl', BinaryType.executable)
-        ])
+        return _CURL_BINARIES
 
     def run_tests(self) -> None:
         pass
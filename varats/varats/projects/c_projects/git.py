@@ -16,6 +16,8 @@ from varats.project.project_util import (
 from varats.provider.cve.cve_provider import CVEProviderHook
 from varats.utils.settings import bb_cfg
 
+_GIT_BINARIES = wrap_paths_to_binaries([("git", BinaryType.executable)])
+
 
 class Git(bb.Project, CVEProviderHook):  # type: ignore
     """Git."""
@@ -38,7 +40,7 @@ class Git(bb.Project, CVEProviderHook):  # type: ignore
     @property
     def binaries(self) -> tp.List[ProjectBinaryWrapper]:
         """Return a list of binaries generated by the project."""
-        return wrap_paths_to_binaries([("git", BinaryType.executable)])
+        return _GIT_BINARIES
 
     def run_tests(self) -> None:
         pass
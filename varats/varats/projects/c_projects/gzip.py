@@ -10,7 +10,9 @@ from plumbum import local
 
 from varats.paper_mgmt.paper_config import project_filter_generator
 from varats.project.project_util import (
+    get_gnulib_reference_path,
     get_tagged_commits,
+    update_git_submodules,
     wrap_paths_to_binaries,
     ProjectBinaryWrapper,
     BinaryType,
@@ -22,6 +24,11 @@ from varats.provider.release.release_provider import (
 )
 from varats.utils.settings import bb_cfg
 
+_MAJOR_RELEASE_REGEX = re.compile(r"^v[0-9]+\.[0-9]+$")
+_MINOR_RELEASE_REGEX = re.compile(r"^v[0-9]+\.[0-9]+(\.[0-9]+)?$")
+
+_GZIP_BINARIES = wrap_paths_to_binaries([("gzip", BinaryType.executable)])
+
 
 class Gzip(bb.Project, ReleaseProviderHook, CVEProviderHook):  # type: ignore
     """Compression and decompression tool Gzip (fetched by Git)"""
@@ -53,7 +60,7 @@ class Gzip(bb.Project, ReleaseProviderHook, CVEProviderHook):  # type: ignore
     @property
     def binaries(self) -> tp.List[ProjectBinaryWrapper]:
         """Return a list of binaries generated by the project."""
-        return wrap_paths_to_binaries([("gzip", BinaryType.executable)])
+        return _GZIP_BINARIES
 
     def run_tests(self) -> None:
         pass
@@ -68,27 +75,28 @@ class Gzip(bb.Project, ReleaseProviderHook, CVEProviderHook):  # type: ignore
         ]
 
         clang = bb.compiler.cc(self)  # type: ignore
+        jobs = get_number_of_jobs(bb_cfg())
         with local.cwd(gzip_version_source):
+            # check out the gnulib submodule from the shared copy, so
+            # bootstrap does not need to clone it
+            update_git_submodules(jobs, reference=get_gnulib_reference_path())
             with local.env(CC=str(clang)):
-                bb.watch(local["./bootstrap"])()  # type: ignore
+                bb.watch(local["./bootstrap"])("--skip-po")  # type: ignore
                 bb.watch(local["./configure"])()  # type: ignore
-            bb.watch(make)("-j", get_number_of_jobs(bb_cfg()))  # type: ignore
+            bb.watch(make)("-j", jobs)  # type: ignore
 
     @classmethod
     def get_release_revisions(
         cls, release_type: ReleaseType
     ) -> tp.List[tp.Tuple[str, str]]:
-        major_release_regex = "^v[0-9]+\\.[0-9]+$"
-        minor_release_regex = "^v[0-9]+\\.[0-9]+(\\.[0-9]+)?$"
-
-        tagged_commits = get_tagged_commits(cls.NAME)
         if release_type == ReleaseType.major:
-            return [(h, tag)
-                    for h, tag in tagged_commits
-                    if re.match(major_release_regex, tag)]
+            release_regex = _MAJOR_RELEASE_REGEX
+        else:
+            release_regex = _MINOR_RELEASE_REGEX
+
         return [(h, tag)
-                for h, tag in tagged_commits
-                if re.match(minor_release_regex, tag)]
+                for h, tag in get_tagged_commits(cls.NAME)
+                if release_regex.match(tag)]
 
     @classmethod
     def get_cve_product_info(cls) -> tp.List[tp.Tuple[str, str]]:
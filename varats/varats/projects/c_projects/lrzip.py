@@ -15,6 +15,8 @@ from varats.project.project_util import (
 from varats.provider.cve.cve_provider import CVEProviderHook
 from varats.utils.settings import bb_cfg
 
+_LRZIP_BINARIES = wrap_paths_to_binaries([("lrzip", BinaryType.executable)])
+
 
 class Lrzip(bb.Project, CVEProviderHook):  # type: ignore
     """Compression and decompression tool lrzip (fetched by Git)"""
@@ -37,7 +39,7 @@ class Lrzip(bb.Project, CVEProviderHook):  # type: ignore
     @property
     def binaries(self) -> tp.List[ProjectBinaryWrapper]:
         """Return a list of binaries generated by the project."""
-        return wrap_paths_to_binaries([("lrzip", BinaryType.executable)])
+        return _LRZIP_BINARIES
 
     def run_tests(self) -> None:
         pass
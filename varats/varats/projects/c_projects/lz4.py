@@ -15,6 +15,8 @@ from varats.project.project_util import (
 from varats.provider.cve.cve_provider import CVEProviderHook
 from varats.utils.settings import bb_cfg
 
+_LZ4_BINARIES = wrap_paths_to_binaries([('lz4', BinaryType.executable)])
+
 
 class Lz4(bb.Project, CVEProviderHook):  # type: ignore
     """
@@ -41,7 +43,7 @@ class Lz4(bb.Project, CVEProviderHook):  # type: ignore
     @property
     def binaries(self) -> tp.List[ProjectBinaryWrapper]:
         """Return a list of binaries generated by the project."""
-        return wrap_paths_to_binaries([('lz4', BinaryType.executable)])
+        return _LZ4_BINARIES
 
     def run_tests(self) -> None:
         pass
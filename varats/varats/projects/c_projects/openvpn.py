@@ -15,6 +15,10 @@ from varats.project.project_util import (
 from varats.provider.cve.cve_provider import CVEProviderHook
 from varats.utils.settings import bb_cfg
 
+_OPENVPN_BINARIES = wrap_paths_to_binaries([
+    ('./src/openvpn/openvpn', BinaryType.executable)
+])
+
 
 class OpenVPN(bb.Project, CVEProviderHook):  # type: ignore
     """
@@ -44,9 +48,7 @@ class OpenVPN(bb.Project, CVEProviderHook):  # type: ignore
     @property
     def binaries(self) -> tp.List[ProjectBinaryWrapper]:
         """Return a list of binaries generated by the project."""
-        return wrap_paths_to_binaries([
-            ('./src/openvpn/openvpn', BinaryType.executable)
-        ])
+        return _OPENVPN_BINARIES
 
     def run_tests(self) -> None:
         pass
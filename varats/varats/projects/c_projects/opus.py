@@ -14,6 +14,10 @@ from varats.project.project_util import (
 )
 from varats.utils.settings import bb_cfg
 
+_OPUS_BINARIES = wrap_paths_to_binaries([
+    (".libs/libopus.so", BinaryType.shared_library)
+])
+
 
 class Opus(bb.Project):  # type: ignore
     """Opus is a codec for interactive speech and audio transmission over the
@@ -37,9 +41,7 @@ class Opus(bb.Project):  # type: ignore
     @property
     def binaries(self) -> tp.List[ProjectBinaryWrapper]:
         """Return a list of binaries generated by the project."""
-        return wrap_paths_to_binaries([
-            (".libs/libopus.so", BinaryType.shared_library)
-        ])
+        return _OPUS_BINARIES
 
     def run_tests(self) -> None:
         pass
@@ -15,6 +15,10 @@ from varats.project.project_util import (
 from varats.provider.cve.cve_provider import CVEProviderHook
 from varats.utils.settings import bb_cfg
 
+_QEMU_BINARIES = wrap_paths_to_binaries([
+    ("build/x86_64-softmmu/qemu-system-x86_64", BinaryType.executable)
+])
+
 
 class Qemu(bb.Project, CVEProviderHook):  # type: ignore
     """
@@ -41,9 +45,7 @@ class Qemu(bb.Project, CVEProviderHook):  # type: ignore
     @property
     def binaries(self) -> tp.List[ProjectBinaryWrapper]:
         """Return a list of binaries generated by the project."""
-        return wrap_paths_to_binaries([
-            ("build/x86_64-softmmu/qemu-system-x86_64", BinaryType.executable)
-        ])
+        return _QEMU_BINARIES
 
     def run_tests(self) -> None:
         pass